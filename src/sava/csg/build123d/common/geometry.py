@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum, auto
+from functools import lru_cache
 from math import acos, atan2, cos, degrees, radians, sin
 from typing import TYPE_CHECKING
 
@@ -11,6 +12,9 @@ from build123d.topology import Mixin1D
 if TYPE_CHECKING:
     from sava.csg.build123d.common.smartsolid import SmartSolid
 
+# Row-major 3x3 rotation matrix
+Matrix3 = tuple[tuple[float, float, float], tuple[float, float, float], tuple[float, float, float]]
+
 TOLERANCE = 1e-6
 DELTA = 1e-8
 # Minimum radius/height for OCCT geometric operations (loft, cylinder, cone).
@@ -143,6 +147,26 @@ def to_vector(vector: VectorLike) -> Vector:
     """
     return vector if vector is None or isinstance(vector, Vector) else Vector(vector)
 
+def to_global_offset(x: float, y: float, z: float, plane: Plane = None) -> Vector:
+    """Converts offsets along a plane's axes to a global offset vector.
+
+    Args:
+        x: Offset along the plane's x_dir (global X if plane is None)
+        y: Offset along the plane's y_dir (global Y if plane is None)
+        z: Offset along the plane's z_dir (global Z if plane is None)
+        plane: Optional plane defining the coordinate system for the offsets
+
+    Returns:
+        The offset in global coordinates
+    """
+    if plane is None:
+        return Vector(x, y, z)
+    # Plane basis times the offsets, summed per component into a single Vector
+    x_dir, y_dir, z_dir = plane.x_dir, plane.y_dir, plane.z_dir
+    return Vector(x_dir.X * x + y_dir.X * y + z_dir.X * z,
+                  x_dir.Y * x + y_dir.Y * y + z_dir.Y * z,
+                  x_dir.Z * x + y_dir.Z * y + z_dir.Z * z)
+
 def snap_to(original_number: float, *round_numbers: float, tolerance: float = TOLERANCE) -> float:
     """Snaps a number to one of multiple target values if within tolerance.
 
@@ -371,18 +395,36 @@ def multi_rotate_vector(vector: VectorLike, plane: Plane, rotations: VectorLike)
     vector = to_vector(vector)
     rotations = to_vector(rotations)
 
-    # Get the plane's axes
-    x_axis = Axis(plane.location.position, plane.x_dir)
-    y_axis = Axis(plane.location.position, plane.y_dir)
-    z_axis = Axis(plane.location.position, plane.z_dir)
-
-    # Apply rotations sequentially: X, then Y, then Z
-    result = vector
-    result = rotate_vector(result, x_axis, rotations.X)
-    result = rotate_vector(result, y_axis, rotations.Y)
-    result = rotate_vector(result, z_axis, rotations.Z)
+    # All three axes pass through the plane origin, so the sequence is one matrix around it
+    matrix = _fixed_axes_rotation_matrix(plane, rotations)
+    return plane.origin + _apply_matrix(matrix, vector - plane.origin)
 
-    return result
+def _axis_rotation_matrix(direction: Vector, angle: float) -> Matrix3:
+    """Rotation matrix for `angle` degrees around the unit `direction` (matrix form of Rodrigues' formula)."""
+    angle_rad = radians(angle)
+    c = cos(angle_rad)
+    s = sin(angle_rad)
+    t = 1 - c
+    x, y, z = direction.X, direction.Y, direction.Z
+    return ((t * x * x + c, t * x * y - s * z, t * x * z + s * y),
+            (t * x * y + s * z, t * y * y + c, t * y * z - s * x),
+            (t * x * z - s * y, t * y * z + s * x, t * z * z + c))
+
+def _multiply_matrices(a: Matrix3, b: Matrix3) -> Matrix3:
+    """Product a·b of two 3x3 matrices: applying it equals applying b, then a."""
+    columns = tuple(zip(*b, strict=True))
+    return tuple(tuple(sum(x * y for x, y in zip(row, column, strict=True)) for column in columns) for row in a)
+
+def _apply_matrix(matrix: Matrix3, vector: Vector) -> Vector:
+    return Vector(*(row[0] * vector.X + row[1] * vector.Y + row[2] * vector.Z for row in matrix))
+
+def _fixed_axes_rotation_matrix(plane: Plane, rotations: Vector) -> Matrix3:
+    """Single matrix for rotating rotations.X degrees around the plane's x_dir, then rotations.Y around
+    its y_dir, then rotations.Z around its z_dir (directions only, the plane origin is not involved)."""
+    x_matrix = _axis_rotation_matrix(plane.x_dir, rotations.X)
+    y_matrix = _axis_rotation_matrix(plane.y_dir, rotations.Y)
+    z_matrix = _axis_rotation_matrix(plane.z_dir, rotations.Z)
+    return _multiply_matrices(z_matrix, _multiply_matrices(y_matrix, x_matrix))
 
 def rotate_axis(axis_to_rotate: Axis, axis_rotate_around: Axis, angle: float) -> Axis:
     """Rotate the direction of `axis_to_rotate` around `axis_rotate_around` by `angle`.
@@ -473,18 +515,9 @@ def convert_orientation_to_rotations(orientation: VectorLike) -> Vector:
     return Vector(angle_c, angle_b, angle_a)
 
 
-def _rotate_single_axis(axis: Axis, rotations: Vector, plane: Plane) -> Axis:
-    axis = rotate_axis(axis, plane.location.x_axis, rotations.X)
-    axis = rotate_axis(axis, plane.location.y_axis, rotations.Y)
-    return rotate_axis(axis, plane.location.z_axis, rotations.Z)
-
 def rotate_orientation(orientation: VectorLike, rotations: VectorLike, plane: Plane) -> Vector:
-    rotations = to_vector(rotations)
-    x_axis, y_axis, z_axis = orient_axis(orientation)
-
-    x_axis = _rotate_single_axis(x_axis, rotations, plane)
-    y_axis = _rotate_single_axis(y_axis, rotations, plane)
-    z_axis = _rotate_single_axis(z_axis, rotations, plane)
+    rotation = _fixed_axes_rotation_matrix(plane, to_vector(rotations))
+    x_axis, y_axis, z_axis = _matrix_axes(_multiply_matrices(rotation, _orientation_matrix(tuple(to_vector(orientation)))))
 
     return calculate_orientation(x_axis, y_axis, z_axis)
 
@@ -493,25 +526,26 @@ def orient_axis(orientation: VectorLike) -> tuple[Axis, Axis, Axis]:
 
     Take a default XY plane, rotate it by orientation.X degree around its axis X, then rotate it by orientation.Y degree around its _new_ axis Y, and finally by orientation.Z degree around its _new_ axis Z.
     """
-    orientation = to_vector(orientation)
+    return _matrix_axes(_orientation_matrix(tuple(to_vector(orientation))))
 
-    # Start with standard XY plane vectors
-    # Apply the orientation transformation using object-attached axes
-    # This simulates the build123d orientation behavior
-
-    # First rotation: around X-axis
-    y_axis = rotate_axis(Axis.Y, Axis.X, orientation.X)
-    z_axis = rotate_axis(Axis.Z, Axis.X, orientation.X)
-
-
-    # Second rotation: around the NEW Y-axis (object-attached)
-    x_axis = rotate_axis(Axis.X, y_axis, orientation.Y)
-    z_axis = rotate_axis(z_axis, y_axis, orientation.Y)
-
-    # Third rotation: around the NEW Z-axis (object-attached)
-    x_axis = rotate_axis(x_axis, z_axis, orientation.Z)
-    y_axis = rotate_axis(y_axis, z_axis, orientation.Z)
+@lru_cache(maxsize=256)
+def _orientation_matrix(orientation: tuple[float, float, float]) -> Matrix3:
+    """Rotation matrix of an orientation, cached by value: solids keep asking for the same few orientations.
 
+    Object-attached rotations X, then the new Y, then the new Z compose as Rx·Ry·Rz; its columns
+    are the rotated X, Y and Z axes. This simulates the build123d orientation behavior.
+    """
+    a, b, c = (radians(angle) for angle in orientation)
+    sa, ca = sin(a), cos(a)
+    sb, cb = sin(b), cos(b)
+    sc, cc = sin(c), cos(c)
+    return ((cb * cc, -cb * sc, sb),
+            (sa * sb * cc + ca * sc, ca * cc - sa * sb * sc, -sa * cb),
+            (sa * sc - ca * sb * cc, ca * sb * sc + sa * cc, ca * cb))
+
+def _matrix_axes(matrix: Matrix3) -> tuple[Axis, Axis, Axis]:
+    """Axes through the origin along the matrix columns: where it takes the X, Y and Z axes."""
+    x_axis, y_axis, z_axis = (Axis((0, 0, 0), column) for column in zip(*matrix, strict=True))
     return x_axis, y_axis, z_axis
 
 def calculate_orientation(x_axis: Axis, y_axis: Axis, z_axis: Axis) -> Vector:
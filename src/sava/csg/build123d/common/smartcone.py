@@ -137,6 +137,11 @@ class SmartCone(SmartSolid):
         orientation = multi_rotate_vector((0, 0, -1), Plane.XY, self._orientation)
         return Axis(position, orientation)
 
+    @property
+    def outer_axis(self) -> Axis:
+        """Axis of the outer cone, taking cone position and orientation into account"""
+        return self.create_axis()
+
     def _create_plane_with_offset(self, offset: float) -> Plane:
         """Create a plane perpendicular to the cone axis at a specific offset distance.
 
@@ -153,7 +158,7 @@ class SmartCone(SmartSolid):
             with proper position and orientation accounting for cone transformations.
         """
         # Get the cone's axis (for outer cone, starting at apex)
-        cone_axis = self.create_axis()
+        cone_axis = self.outer_axis
 
         # Calculate the plane position by moving along the axis direction
         plane_position = cone_axis.position + cone_axis.direction * offset
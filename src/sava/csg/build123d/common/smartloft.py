@@ -2,7 +2,7 @@ from copy import copy
 
 from build123d import Axis, Face, Location, Plane, Vector, VectorLike, Wire, extrude, loft
 
-from sava.csg.build123d.common.geometry import multi_rotate_vector, rotate_vector
+from sava.csg.build123d.common.geometry import multi_rotate_vector, rotate_vector, to_global_offset
 from sava.csg.build123d.common.smartsolid import SmartSolid
 
 
@@ -79,10 +79,7 @@ class SmartLoft(SmartSolid):
     def move(self, x: float = 0, y: float = 0, z: float = 0, plane: Plane = None) -> 'SmartLoft':
         super().move(x, y, z, plane=plane)
         # Convert plane-local offsets to global coordinates if plane is specified
-        if plane is not None:
-            global_offset = plane.x_dir * x + plane.y_dir * y + plane.z_dir * z
-        else:
-            global_offset = Vector(x, y, z)
+        global_offset = to_global_offset(x, y, z, plane)
         location = Location(global_offset)
         self.base_profile = self.base_profile.move(location)
         self.target_profile = self.target_profile.move(location)
@@ -58,9 +58,12 @@ class SmartRevolve(SmartSolid):
         Returns:
             Plane at the specified angular position, correctly transformed
         """
-        # 1. Rotate original plane by angle * t around original axis
+        # 1. Rotate original plane by angle * t around original axis (whole turns, e.g. t=0, keep it as is)
         rotation_angle = self.angle * t
-        plane = rotate_plane(self.sketch_plane, self.axis, rotation_angle)
+        if rotation_angle % 360 == 0:
+            plane = Plane(origin=self.sketch_plane.origin, x_dir=self.sketch_plane.x_dir, z_dir=self.sketch_plane.z_dir)
+        else:
+            plane = rotate_plane(self.sketch_plane, self.axis, rotation_angle)
 
         # 2. Apply current orientation (from SmartSolid._orientation)
         if self._orientation.length > 1e-10:
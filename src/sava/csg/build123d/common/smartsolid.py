@@ -5,13 +5,15 @@ from math import radians, tan
 from typing import TYPE_CHECKING, Any
 
 from build123d import Axis, BoundBox, Color, Compound, Edge, GeomType, Location, Plane, Shape, ShapeList, ShapePredicate, SkipClean, Vector, VectorLike, fillet, mirror, scale
+from OCP.Bnd import Bnd_Box
 from OCP.gp import gp_Ax1, gp_Dir, gp_Pnt, gp_Trsf
+from OCP.TopoDS import TopoDS_Shape
 
 from sava.common.common import flatten
 from sava.common.logging import logger
 from sava.csg.build123d.common.alignmentbuilder import AlignmentBuilder
 from sava.csg.build123d.common.edgefilters import AxisFilter, EdgeFilter, FilletDebug, PositionalFilter, SurfaceFilter, filter_edges_by_axis, filter_edges_by_position, filter_edges_by_surface
-from sava.csg.build123d.common.geometry import Alignment, Direction, axis_to_string, calculate_orientation, calculate_position, multi_rotate_vector, orient_axis, rotate_axis, rotate_orientation, rotate_vector, to_vector
+from sava.csg.build123d.common.geometry import Alignment, Direction, axis_to_string, calculate_orientation, calculate_position, multi_rotate_vector, orient_axis, rotate_axis, rotate_orientation, rotate_vector, to_global_offset, to_vector
 
 
 def get_solid(element: Any, apply_bed_orientation: bool = False) -> Any:
@@ -96,6 +98,7 @@ class SmartSolid:
         # solid.orientation); assuming (0,0,0) here would make rotate()/transform-replay drop it.
         self._orientation = Vector(self.solid.orientation) if self.solid is not None and not isinstance(self.solid, ShapeList) else Vector(0, 0, 0)
         self.bed_orientation: VectorLike | None = None
+        self._bound_box: tuple[TopoDS_Shape, BoundBox] | None = None
         self._reanchor()
         self.assert_valid()
 
@@ -148,21 +151,47 @@ class SmartSolid:
 
     @property
     def bound_box(self) -> BoundBox:
-        return self.wrap_solid().bounding_box()
+        solid = self.solid
+        if solid is None:
+            raise ValueError("Cannot get bound box of None solid")
+        if isinstance(solid, ShapeList) or solid.wrapped is None:
+            return self.wrap_solid().bounding_box()
+        # The optimal bounding box is expensive, so it is cached against a snapshot of the TopoDS handle:
+        # in-place moves change the handle's location and rebuilt solids get a new TShape, either of
+        # which makes IsEqual fail, so a cached box is only reused while the geometry is unchanged
+        if self._bound_box is not None and self._bound_box[0].IsEqual(solid.wrapped):
+            return self._bound_box[1]
+        bound_box = solid.bounding_box()
+        self._bound_box = solid.wrapped.Located(solid.wrapped.Location()), bound_box
+        return bound_box
 
     @property
     def shapes(self) -> ShapeList:
         return self.solid if isinstance(self.solid, ShapeList) else [self.solid]
 
     def get_bound_box(self, plane: Plane = Plane.XY) -> BoundBox:
-        solid = self.wrap_solid()
-        if plane == Plane.XY:
-            return solid.bounding_box()
+        # Plane axes parallel to world axes (XY, XZ, YZ and their flips/offsets): signed permutation of the
+        # world bound box, so the solid does not need to be moved into the plane's coordinate system
+        bounds = [self._world_parallel_bounds(plane.origin, direction) for direction in (plane.x_dir, plane.y_dir, plane.z_dir)]
+        if all(bound is not None for bound in bounds):
+            (x_min, x_max), (y_min, y_max), (z_min, z_max) = bounds
+            return BoundBox(Bnd_Box(gp_Pnt(x_min, y_min, z_min), gp_Pnt(x_max, y_max, z_max)))
 
         # Transform solid to the plane's coordinate system
-        transformed = solid.moved(plane.location.inverse())
+        transformed = self.wrap_solid().moved(plane.location.inverse())
         return transformed.bounding_box()
 
+    def _world_parallel_bounds(self, position: Vector, direction: Vector) -> tuple[float, float] | None:
+        """Bounds along a direction parallel to a world axis, read from the world bound box; None for any other direction"""
+        direction = direction.normalized()
+        for index, component in enumerate(direction):
+            if abs(component) > 1 - 1e-12:
+                bound_box = self.bound_box
+                offset = tuple(position)[index]
+                low, high = tuple(bound_box.min)[index] - offset, tuple(bound_box.max)[index] - offset
+                return (low, high) if component > 0 else (-high, -low)
+        return None
+
     def create_bound_box(self, plane: Plane = Plane.XY) -> 'SmartBox':
         bound_box = self.get_bound_box(plane)
         from sava.csg.build123d.common.smartbox import SmartBox
@@ -257,10 +286,7 @@ class SmartSolid:
             self for chaining
         """
         # Convert plane-local offsets to global coordinates if plane is specified
-        if plane is not None:
-            global_offset = plane.x_dir * x + plane.y_dir * y + plane.z_dir * z
-        else:
-            global_offset = Vector(x, y, z)
+        global_offset = to_global_offset(x, y, z, plane)
 
         # Move each shape separately if it's a ShapeList, otherwise move the single shape
         location = Location(global_offset)
@@ -298,7 +324,9 @@ class SmartSolid:
 
     def orient(self, rotations: VectorLike) -> 'SmartSolid':
         self.solid = self.wrap_solid()
-        self.solid.orientation = rotations
+        # Re-applying the current orientation would rebuild the location (and drop the cached bound box) for nothing
+        if (self.solid.orientation - to_vector(rotations)).length > 1e-9:
+            self.solid.orientation = rotations
         self._orientation = to_vector(rotations)
         return self
 
@@ -382,6 +410,9 @@ class SmartSolid:
     #  - while following the same order of rotations, axis are not attached to the object, but fixed to a plane specified as a parameter
     #  - rotations are incremental, and (0,0,0) param will not change orientation no matter what
     def rotate_multi(self, rotations: VectorLike, plane: Plane = Plane.XY) -> 'SmartSolid':
+        # Whole turns around every axis change neither orientation nor origin: skip the OCCT work
+        if all(angle % 360 == 0 for angle in to_vector(rotations)):
+            return self
         old_origin = Vector(self.origin)
         self.orient(rotate_orientation(self._orientation, rotations, plane))
         new_origin = multi_rotate_vector(old_origin, plane, rotations)
@@ -401,7 +432,8 @@ class SmartSolid:
     def get_bounds_along_axis(self, axis: Axis) -> tuple[float, float]:
         """Get min and max coordinates of the solid along the specified axis direction.
 
-        This method creates a plane where the axis direction becomes the Z-axis,
+        For axes parallel to a world axis the bounds are read from the world bound box.
+        Otherwise this method creates a plane where the axis direction becomes the Z-axis,
         then uses get_bound_box() to get bounds in that coordinate system.
 
         Args:
@@ -413,9 +445,15 @@ class SmartSolid:
         if self.solid is None:
             raise RuntimeError("Cannot get bounds of None solid")
 
-        # Create a plane where the axis direction becomes the Z-axis
         axis_direction = axis.direction.normalized()
 
+        # Parallel to a world axis: project the world bound box, no transformed copy to measure
+        bounds = self._world_parallel_bounds(axis.position, axis_direction)
+        if bounds is not None:
+            return bounds
+
+        # Create a plane where the axis direction becomes the Z-axis
+
         # Create plane with axis origin and axis direction as Z-axis
         plane = Plane(axis.position, z_dir=axis_direction)
 
@@ -743,11 +781,14 @@ class SmartSolid:
 
     def _copy_base_fields(self, target: 'SmartSolid', label: str = None) -> None:
         """Copy base class fields to target. Called by subclass copy() methods."""
-        target.solid = copy(self.solid)
+        # Shape.move() works in place, so a ShapeList copy needs its own shapes, not just its own list
+        target.solid = ShapeList(copy(shape) for shape in self.solid) if isinstance(self.solid, ShapeList) else copy(self.solid)
         target.label = label or self.label
         target.origin = Vector(self.origin)
         target._orientation = Vector(self._orientation)
         target.bed_orientation = self.bed_orientation
+        # The copied solid shares the TShape and location, so the cached bound box stays valid for it
+        target._bound_box = self._bound_box
 
     def _scale_solid(self, factor_x: float, factor_y: float, factor_z: float) -> Shape:
         factor_y = factor_y or factor_x
@@ -817,24 +858,30 @@ class SmartSolid:
             sign = 1 if keep >= 0 else -1
             cut = sign * (size - abs(keep))
         elif keep_fraction is not None:
-            if not (-1 < keep_fraction < 0 or 0 < keep_fraction < 1):
+            if not 0 < abs(keep_fraction) < 1:
                 raise ValueError(f"keep_fraction must satisfy -1 < f < 0 or 0 < f < 1, got {keep_fraction}")
             sign = 1 if keep_fraction >= 0 else -1
             cut_fraction = sign * (1 - abs(keep_fraction))
         if cut_fraction is not None:
-            if not (-1 < cut_fraction < 0 or 0 < cut_fraction < 1):
+            if not 0 < abs(cut_fraction) < 1:
                 raise ValueError(f"cut_fraction must satisfy -1 < f < 0 or 0 < f < 1, got {cut_fraction}")
             return size * cut_fraction
         return cut
 
+    def _cut_axis(self, index: int, cut: float | None, cut_fraction: float | None, keep: float | None, keep_fraction: float | None) -> 'SmartSolid':
+        """Shared body of cut_x/cut_y/cut_z: index selects the world axis (0 = X, 1 = Y, 2 = Z)."""
+        offsets = [0.0, 0.0, 0.0]
+        offsets[index] = self._resolve_cut_offset(cut, cut_fraction, keep, keep_fraction, tuple(self.bound_box.size)[index])
+        return self.cut_off(*offsets)
+
     def cut_x(self, cut: float = None, cut_fraction: float = None, keep: float = None, keep_fraction: float = None) -> 'SmartSolid':
         """Cut along X. cut/keep: absolute. cut_fraction/keep_fraction: relative to x_size."""
-        return self.cut_off(x=self._resolve_cut_offset(cut, cut_fraction, keep, keep_fraction, self.x_size))
+        return self._cut_axis(0, cut, cut_fraction, keep, keep_fraction)
 
     def cut_y(self, cut: float = None, cut_fraction: float = None, keep: float = None, keep_fraction: float = None) -> 'SmartSolid':
         """Cut along Y. cut/keep: absolute. cut_fraction/keep_fraction: relative to y_size."""
-        return self.cut_off(y=self._resolve_cut_offset(cut, cut_fraction, keep, keep_fraction, self.y_size))
+        return self._cut_axis(1, cut, cut_fraction, keep, keep_fraction)
 
     def cut_z(self, cut: float = None, cut_fraction: float = None, keep: float = None, keep_fraction: float = None) -> 'SmartSolid':
         """Cut along Z. cut/keep: absolute. cut_fraction/keep_fraction: relative to z_size."""
-        return self.cut_off(z=self._resolve_cut_offset(cut, cut_fraction, keep, keep_fraction, self.z_size))
+        return self._cut_axis(2, cut, cut_fraction, keep, keep_fraction)
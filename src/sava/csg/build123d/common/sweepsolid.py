@@ -2,7 +2,7 @@ from copy import copy
 
 from build123d import Axis, Location, Plane, SweepType, Vector, VectorLike, Wire, sweep
 
-from sava.csg.build123d.common.geometry import create_plane_from_planes, create_wire_tangent_plane, orient_plane
+from sava.csg.build123d.common.geometry import create_plane_from_planes, create_wire_tangent_plane, orient_plane, to_global_offset
 from sava.csg.build123d.common.smartsolid import SmartSolid
 
 
@@ -27,10 +27,7 @@ class SweepSolid(SmartSolid):
     def move(self, x: float = 0, y: float = 0, z: float = 0, plane: Plane = None) -> 'SweepSolid':
         super().move(x, y, z, plane=plane)
         # Convert plane-local offsets to global coordinates if plane is specified
-        if plane is not None:
-            global_offset = plane.x_dir * x + plane.y_dir * y + plane.z_dir * z
-        else:
-            global_offset = Vector(x, y, z)
+        global_offset = to_global_offset(x, y, z, plane)
         location = Location(global_offset)
         self.path = self.path.move(location)
         self.plane_path.origin += global_offset
@@ -5,7 +5,7 @@ from build123d import Axis, Edge, Plane, ShapeList, Vector
 from parameterized import parameterized
 
 from sava.csg.build123d.common.edgefilters import filter_edges_by_axis, filter_edges_by_position
-from sava.csg.build123d.common.geometry import Direction, calculate_orientation, convert_orientation_to_rotations, multi_rotate_vector, orient_axis, orient_plane, rotate_plane, rotate_vector
+from sava.csg.build123d.common.geometry import Direction, calculate_orientation, convert_orientation_to_rotations, multi_rotate_vector, orient_axis, orient_plane, rotate_plane, rotate_vector, to_global_offset
 from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
 
 
@@ -204,10 +204,13 @@ class TestMultiRotateVector(unittest.TestCase):
         assertVectorAlmostEqual(self, result, expected)
 
 
-    def test_multi_rotate_vector_sequential_equivalence(self) -> None:
+    @parameterized.expand([
+        (Plane.XY,),
+        (Plane((5, -3, 2), x_dir=(1, 1, 0), z_dir=(0, 0, 1)),),  # Off-origin, tilted: rotates around its origin
+    ])
+    def test_multi_rotate_vector_sequential_equivalence(self, plane) -> None:
         """Test that multi_rotate_vector equals sequential single rotations"""
         vector = Vector(1, 2, 3)
-        plane = Plane.XY
         rotations = Vector(30, 45, 60)
 
         # Multi-rotation approach
@@ -456,6 +459,24 @@ class TestOrientPlane(unittest.TestCase):
         assertVectorAlmostEqual(self, result.z_dir, z_axis.direction)
 
 
+class TestToGlobalOffset(unittest.TestCase):
+    """Tests for to_global_offset() converting plane-local offsets to global ones."""
+
+    @parameterized.expand([
+        (None, (1, 2, 3)),
+        (Plane.XY, (1, 2, 3)),
+        (Plane.XZ, (1, -3, 2)),     # x_dir=(1,0,0), y_dir=(0,0,1), z_dir=(0,-1,0)
+        (Plane.YZ, (3, 1, 2)),      # x_dir=(0,1,0), y_dir=(0,0,1), z_dir=(1,0,0)
+    ])
+    def test_to_global_offset(self, plane: Plane, expected: tuple) -> None:
+        assertVectorAlmostEqual(self, to_global_offset(1, 2, 3, plane), expected)
+
+    def test_to_global_offset_matches_basis_sum(self) -> None:
+        plane = Plane((5, 5, 5), x_dir=(1, 1, 0), z_dir=(0, 0, 1))
+        expected = plane.x_dir * 4 + plane.y_dir * -2 + plane.z_dir * 7
+        assertVectorAlmostEqual(self, to_global_offset(4, -2, 7, plane), expected)
+
+
 class TestDirectionRotate(unittest.TestCase):
     """Tests for Direction.rotate() using our own math."""
 
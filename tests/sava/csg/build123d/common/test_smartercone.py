@@ -5,83 +5,59 @@ from parameterized import parameterized
 
 from sava.csg.build123d.common.geometry import MIN_SIZE_OCCT, are_points_too_close
 from sava.csg.build123d.common.smartercone import InnerMode, SmarterCone
-from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
+from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual, assertVectorsAlmostEqual
 
 
 class TestSmarterConeShell(unittest.TestCase):
 
-    def test_shell_positive_creates_correct_geometry(self) -> None:
-        """Test that positive thickness creates outer shell with correct sections"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
-        shell = cone.create_shell(2)
-
-        self.assertAlmostEqual(shell.sections[0].radius, 52, places=5)
-        self.assertAlmostEqual(shell.sections[0].inner_radius, 50, places=5)
-        self.assertAlmostEqual(shell.sections[1].radius, 32, places=5)
-        self.assertAlmostEqual(shell.sections[1].inner_radius, 30, places=5)
-        self.assertAlmostEqual(shell.height, 100)
-
-    def test_shell_negative_creates_correct_geometry(self) -> None:
-        """Test shell with negative thickness (inner shell)"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
-        shell = cone.create_shell(-2)
-
-        self.assertAlmostEqual(shell.sections[0].radius, 50, places=5)
-        self.assertAlmostEqual(shell.sections[0].inner_radius, 48, places=5)
-        self.assertAlmostEqual(shell.sections[1].radius, 30, places=5)
-        self.assertAlmostEqual(shell.sections[1].inner_radius, 28, places=5)
-        self.assertAlmostEqual(shell.height, 100)
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Read-only: create_shell/copy return new instances and leave the cones untouched
+        cls.base_cone = SmarterCone.base(50).extend(radius=30, height=100)
+        cls.xz_half_cone = SmarterCone.base(50, plane=Plane.XZ, angle=180).extend(radius=30, height=100)
+        cls.base_radii = [s.radius for s in cls.base_cone.sections]
+        cls.shell = cls.base_cone.create_shell(2)
 
     def test_shell_prevents_double_shelling(self) -> None:
         """Test that shell cannot be called on already hollow cone"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
-        shell = cone.create_shell(2)
-
         with self.assertRaises(AssertionError) as context:
-            shell.create_shell(1)
+            self.shell.create_shell(1)
 
         self.assertIn("already hollow", str(context.exception).lower())
 
     def test_shell_requires_nonzero_thickness(self) -> None:
         """Test that thickness must be non-zero"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
+        cone = self.base_cone
 
         with self.assertRaises(AssertionError) as context:
             cone.create_shell(0)
 
         self.assertIn("non-zero", str(context.exception).lower())
 
-    @parameterized.expand([
-        (2,),
-        (-2,),
-        (5,),
-        (-4,),
-    ])
-    def test_shell_valid_combinations(self, thickness) -> None:
-        """Test shell with various valid thickness values produces correct wall thickness"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
-        shell = cone.create_shell(thickness)
-        self.assertTrue(shell.has_inner)
-        for s in shell.sections:
-            self.assertAlmostEqual(s.radius - s.inner_radius, abs(thickness), places=5)
+    def test_shell_valid_combinations(self) -> None:
+        """Test shell with various valid thickness values: positive grows outward, negative grows inward"""
+        for thickness in (2, -2, 5, -4):
+            with self.subTest(thickness=thickness):
+                shell = self.base_cone.create_shell(thickness)
+                self.assertTrue(shell.has_inner)
+                self.assertAlmostEqual(shell.height, 100)
+                expected = [(radius + max(thickness, 0), radius + min(thickness, 0)) for radius in self.base_radii]
+                assertVectorsAlmostEqual(self, [(s.radius, s.inner_radius) for s in shell.sections], expected)
 
     def test_shell_returns_new_instance(self) -> None:
         """Test that shell returns new instance, not self"""
-        cone = SmarterCone.base(50).extend(radius=30, height=100)
-        shell = cone.create_shell(2)
-        self.assertIsNot(shell, cone)
-        self.assertIsInstance(shell, SmarterCone)
+        self.assertIsNot(self.shell, self.base_cone)
+        self.assertIsInstance(self.shell, SmarterCone)
 
     def test_shell_inherits_plane_and_angle(self) -> None:
         """Test that shell inherits plane and angle"""
-        cone = SmarterCone.base(50, plane=Plane.XZ, angle=180).extend(radius=30, height=100)
-        shell = cone.create_shell(2)
+        shell = self.xz_half_cone.create_shell(2)
         self.assertEqual(shell.plane, Plane.XZ)
         self.assertEqual(shell.angle, 180)
 
     def test_copy_returns_smartercone(self) -> None:
         """Test that copy() returns a SmarterCone instance"""
-        cone = SmarterCone.base(50, plane=Plane.XZ, angle=180).extend(radius=30, height=100)
+        cone = self.xz_half_cone
         copied = cone.copy()
 
         self.assertIsInstance(copied, SmarterCone)
@@ -94,57 +70,50 @@ class TestSmarterConeShell(unittest.TestCase):
 
 class TestSmarterConeCreateOffset(unittest.TestCase):
 
-    def test_create_offset_positive_radius(self) -> None:
-        """Test creating offset cone with positive radial thickness"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
-        offset = original.create_offset(2)
-
-        self.assertAlmostEqual(offset.base_radius, 52, places=5)
-        self.assertAlmostEqual(offset.top_radius, 32, places=5)
-        self.assertEqual(offset.height, 100)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.base_cone = SmarterCone.base(50).extend(radius=30, height=100)
+        cls.xz_half_cone = SmarterCone.base(50, plane=Plane.XZ, angle=180).extend(radius=30, height=100)
+        cls.originals = {
+            "normal": cls.base_cone,
+            "inverted": SmarterCone.base(30).extend(radius=50, height=100),
+            "cylinder": SmarterCone.cylinder(50, 100),
+        }
 
-    def test_create_offset_negative_radius(self) -> None:
-        """Test creating offset cone with negative radial thickness"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
-        offset = original.create_offset(-2)
+    @parameterized.expand([
+        ("normal", 2, 52, 32),      # Positive radial thickness
+        ("normal", -2, 48, 28),     # Negative radial thickness
+        ("normal", 0, 50, 30),      # Zero offset is allowed
+        ("normal", -30, 20, 0),     # Shrinks the top to a point
+        ("inverted", 2, 32, 52),    # Top wider than base
+        ("cylinder", -5, 45, 45),
+    ])
+    def test_create_offset_radius(self, original, thickness, expected_base, expected_top) -> None:
+        """Test creating offset cone with various radial thicknesses"""
+        offset = self.originals[original].create_offset(thickness)
 
-        self.assertAlmostEqual(offset.base_radius, 48, places=5)
-        self.assertAlmostEqual(offset.top_radius, 28, places=5)
+        self.assertAlmostEqual(offset.base_radius, expected_base, places=5)
+        self.assertAlmostEqual(offset.top_radius, expected_top, places=5)
         self.assertEqual(offset.height, 100)
 
-    def test_create_offset_zero_allowed(self) -> None:
-        """Test that zero offset is allowed"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
-        offset = original.create_offset(0)
-        self.assertAlmostEqual(offset.base_radius, 50, places=5)
-        self.assertAlmostEqual(offset.top_radius, 30, places=5)
-
     def test_create_offset_inherits_plane_and_angle(self) -> None:
         """Test that offset cone inherits plane and angle"""
-        original = SmarterCone.base(50, plane=Plane.XZ, angle=180).extend(radius=30, height=100)
-        offset = original.create_offset(2)
+        offset = self.xz_half_cone.create_offset(2)
         self.assertEqual(offset.plane, Plane.XZ)
         self.assertEqual(offset.angle, 180)
 
     def test_create_offset_returns_smartercone(self) -> None:
         """Test that create_offset returns SmarterCone instance"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
+        original = self.base_cone
         offset = original.create_offset(2)
         self.assertIsInstance(offset, SmarterCone)
 
-    def test_create_offset_inverted_cone(self) -> None:
-        """Test create_offset on inverted cone (top > base)"""
-        original = SmarterCone.base(30).extend(radius=50, height=100)
-        offset = original.create_offset(2)
-        self.assertAlmostEqual(offset.base_radius, 32, places=5)
-        self.assertAlmostEqual(offset.top_radius, 52, places=5)
-
-    def test_create_offset_positioning(self) -> None:
+    @parameterized.expand([(2,), (-2,), (-5,)])
+    def test_create_offset_positioning(self, thickness) -> None:
         """Test that offset cone is colocated with original"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
-        offset = original.create_offset(2)
-        self.assertAlmostEqual(offset.z_min, original.z_min, places=3)
-        self.assertAlmostEqual(offset.z_max, original.z_max, places=3)
+        offset = self.base_cone.create_offset(thickness)
+        self.assertAlmostEqual(offset.z_min, self.base_cone.z_min, places=3)
+        self.assertAlmostEqual(offset.z_max, self.base_cone.z_max, places=3)
 
     def test_create_offset_with_inner_radius(self) -> None:
         """Test that create_offset adjusts both outer and inner radii"""
@@ -157,7 +126,7 @@ class TestSmarterConeCreateOffset(unittest.TestCase):
 
     def test_create_offset_negative_rejects_too_small_radius(self) -> None:
         """Test that negative offset raising assertion when outer radius would go negative"""
-        original = SmarterCone.base(50).extend(radius=30, height=100)
+        original = self.base_cone
         with self.assertRaises(AssertionError):
             original.create_offset(-35)
 
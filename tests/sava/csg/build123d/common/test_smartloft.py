@@ -3,56 +3,60 @@
 import unittest
 
 from build123d import Axis, Circle, Vector
+from parameterized import parameterized
 
 from sava.csg.build123d.common.smartloft import SmartLoft
-from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
+from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual, assertVectorsAlmostEqual
 
 
 class TestSmartLoftProfileTracking(unittest.TestCase):
     """Tests for base_profile and target_profile tracking through move/rotate/orient."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # SmartLoft.create copies its input faces, so the profiles can be shared across tests
+        cls.base_face = Circle(10).face()
+        cls.target_face = Circle(5).face()
+        # Lofting is the expensive part; each test transforms its own copy of this template
+        cls.template = SmartLoft.create(cls.base_face, cls.target_face, height=20)
+
     def _create_smart_loft(self) -> SmartLoft:
         """Create a simple SmartLoft for testing."""
-        base = Circle(10).face()
-        target = Circle(5).face()
-        return SmartLoft.create(base, target, height=20)
+        return self.template.copy()
 
-    def test_initial_profile_positions(self) -> None:
-        """Test that profiles are at correct initial positions."""
-        loft = self._create_smart_loft()
-
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 0, 0))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, 0, 20))
-
-    def test_move_tracks_profiles(self) -> None:
-        """Test that move() updates profile positions."""
+    def test_create_leaves_input_faces_untouched(self) -> None:
+        """Test that create(), copy() and later transforms don't move the shared faces or template."""
         loft = self._create_smart_loft()
         loft.move(10, 20, 30)
+        loft.rotate(Axis.X, 90)
 
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(10, 20, 30))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(10, 20, 50))
+        assertVectorAlmostEqual(self, self.base_face.center(), Vector(0, 0, 0))
+        assertVectorAlmostEqual(self, self.target_face.center(), Vector(0, 0, 0))
+        assertVectorsAlmostEqual(self, [self.template.base_profile.center(), self.template.target_profile.center()], [(0, 0, 0), (0, 0, 20)])
 
-    def test_rotate_z_tracks_profiles(self) -> None:
-        """Test that rotate() around Z axis updates profile positions."""
+    def test_initial_profile_positions(self) -> None:
+        """Test that profiles are at correct initial positions."""
         loft = self._create_smart_loft()
-        # Move off-center first so rotation has visible effect on position
-        loft.move(10, 0, 0)
-        loft.rotate(Axis.Z, 90)
-
-        # (10, 0, 0) rotated 90° around Z becomes (0, 10, 0)
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 10, 0))
-        # (10, 0, 20) rotated 90° around Z becomes (0, 10, 20)
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, 10, 20))
 
-    def test_rotate_x_tracks_profiles(self) -> None:
-        """Test that rotate() around X axis updates profile positions."""
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [(0, 0, 0), (0, 0, 20)])
+
+    @parameterized.expand([
+        # (10, 20, 30) translation moves both profiles by the same offset
+        ("move", [("move", (10, 20, 30))], (10, 20, 30), (10, 20, 50)),
+        # Off-center (10, 0, 0) rotated 90° around Z becomes (0, 10, 0)
+        ("move_rotate_z", [("move", (10, 0, 0)), ("rotate", (Axis.Z, 90))], (0, 10, 0), (0, 10, 20)),
+        # Base at origin stays at origin; (0, 0, 20) rotated 90° around X becomes (0, -20, 0)
+        ("rotate_x", [("rotate", (Axis.X, 90))], (0, 0, 0), (0, -20, 0)),
+        # Rotating the centered loft around Z keeps both centers, then move shifts them
+        ("rotate_z_move", [("rotate", (Axis.Z, 90)), ("move", (10, 20, 30))], (10, 20, 30), (10, 20, 50)),
+    ])
+    def test_transformations_track_profiles(self, _name, operations, expected_base, expected_target) -> None:
+        """Test that move()/rotate() sequences update profile positions."""
         loft = self._create_smart_loft()
-        loft.rotate(Axis.X, 90)
+        for method, args in operations:
+            getattr(loft, method)(*args)
 
-        # Base at origin stays at origin
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 0, 0))
-        # (0, 0, 20) rotated 90° around X becomes (0, -20, 0)
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, -20, 0))
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [expected_base, expected_target])
 
     def test_orient_tracks_profiles(self) -> None:
         """Test that orient() updates profile orientations."""
@@ -63,26 +67,6 @@ class TestSmartLoftProfileTracking(unittest.TestCase):
         self.assertEqual(loft.base_profile.orientation, Vector(90, 0, 0))
         self.assertEqual(loft.target_profile.orientation, Vector(90, 0, 0))
 
-    def test_combined_move_rotate(self) -> None:
-        """Test profiles track through move then rotate."""
-        loft = self._create_smart_loft()
-        loft.move(10, 0, 0)
-        loft.rotate(Axis.Z, 90)
-
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 10, 0))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, 10, 20))
-
-    def test_combined_rotate_move(self) -> None:
-        """Test profiles track through rotate then move."""
-        loft = self._create_smart_loft()
-        loft.rotate(Axis.Z, 90)
-        loft.move(10, 20, 30)
-
-        # After rotate: base at (0,0,0), top at (0,0,20)
-        # After move: base at (10,20,30), top at (10,20,50)
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(10, 20, 30))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(10, 20, 50))
-
     def test_profiles_match_solid_center(self) -> None:
         """Test that profile centers stay aligned with solid after transformations."""
         loft = self._create_smart_loft()
@@ -97,39 +81,40 @@ class TestSmartLoftProfileTracking(unittest.TestCase):
 class TestSmartLoftExtrude(unittest.TestCase):
     """Tests for SmartLoft.extrude() profile tracking."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # SmartLoft.extrude copies its input face, so the profile can be shared across tests
+        cls.profile = Circle(10).face()
+
     def test_extrude_initial_positions(self) -> None:
         """Test that extrude creates profiles at correct positions."""
-        profile = Circle(10).face()
-        loft = SmartLoft.extrude(profile, 30)
+        loft = SmartLoft.extrude(self.profile, 30)
 
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 0, 0))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, 0, 30))
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [(0, 0, 0), (0, 0, 30)])
 
     def test_extrude_negative_direction(self) -> None:
         """Test extrude with negative Z direction."""
-        profile = Circle(10).face()
-        loft = SmartLoft.extrude(profile, 20, direction=(0, 0, -1))
+        loft = SmartLoft.extrude(self.profile, 20, direction=(0, 0, -1))
 
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(0, 0, 0))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(0, 0, -20))
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [(0, 0, 0), (0, 0, -20)])
 
     def test_extrude_move_tracks_profiles(self) -> None:
         """Test that move() works on extruded SmartLoft."""
-        profile = Circle(10).face()
-        loft = SmartLoft.extrude(profile, 30)
+        loft = SmartLoft.extrude(self.profile, 30)
         loft.move(5, 10, 15)
 
-        assertVectorAlmostEqual(self, loft.base_profile.center(), Vector(5, 10, 15))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), Vector(5, 10, 45))
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [(5, 10, 15), (5, 10, 45)])
 
 
 class TestSmartLoftConsecutiveRotations(unittest.TestCase):
     """Tests for consecutive rotate() calls on SmartLoft."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.template = SmartLoft.create(Circle(10).face(), Circle(5).face(), height=20)
+
     def _create_smart_loft(self) -> SmartLoft:
-        base = Circle(10).face()
-        target = Circle(5).face()
-        return SmartLoft.create(base, target, height=20)
+        return self.template.copy()
 
     def test_two_z_rotations_equal_single(self) -> None:
         """Two 45° Z rotations should equal one 90° rotation for profile tracking."""
@@ -142,8 +127,7 @@ class TestSmartLoftConsecutiveRotations(unittest.TestCase):
         loft2.move(10, 0, 0)
         loft2.rotate(Axis.Z, 90)
 
-        assertVectorAlmostEqual(self, loft1.base_profile.center(), loft2.base_profile.center())
-        assertVectorAlmostEqual(self, loft1.target_profile.center(), loft2.target_profile.center())
+        assertVectorsAlmostEqual(self, [loft1.base_profile.center(), loft1.target_profile.center()], [loft2.base_profile.center(), loft2.target_profile.center()])
 
     def test_rotate_move_rotate_profiles(self) -> None:
         """Test rotate + move + rotate sequence tracks profiles correctly."""
@@ -160,21 +144,18 @@ class TestSmartLoftConsecutiveRotations(unittest.TestCase):
 
         loft.rotate(Axis.Z, 90)
         # base: (5,10,0) -> (-10,5,0), target: (5,10,20) -> (-10,5,20)
-        assertVectorAlmostEqual(self, loft.base_profile.center(), (-10, 5, 0))
-        assertVectorAlmostEqual(self, loft.target_profile.center(), (-10, 5, 20))
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], [(-10, 5, 0), (-10, 5, 20)])
 
     def test_four_90_rotations_return_to_original(self) -> None:
         """4x 90° Z rotation should return profiles to original positions."""
         loft = self._create_smart_loft()
         loft.move(10, 5, 0)
-        original_base = Vector(loft.base_profile.center())
-        original_target = Vector(loft.target_profile.center())
+        original_centers = [loft.base_profile.center(), loft.target_profile.center()]
 
         for _ in range(4):
             loft.rotate(Axis.Z, 90)
 
-        assertVectorAlmostEqual(self, loft.base_profile.center(), original_base)
-        assertVectorAlmostEqual(self, loft.target_profile.center(), original_target)
+        assertVectorsAlmostEqual(self, [loft.base_profile.center(), loft.target_profile.center()], original_centers)
 
 
 if __name__ == "__main__":
@@ -5,18 +5,26 @@ from parameterized import parameterized
 
 from sava.csg.build123d.common.pencil import Pencil
 from sava.csg.build123d.common.smartrevolve import SmartRevolve
-from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
+from tests.sava.csg.build123d.test_utils import VECTOR_TOLERANCE, assertVectorAlmostEqual, assertVectorsAlmostEqual
 
 
-class TestSmartRevolveBasic(unittest.TestCase):
+class _RevolveFixture:
+    """Shared helper for the test classes below: revolves a small rectangle sketched on XZ."""
 
-    def _create_simple_revolve(self, angle: float = 360, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing - a small rectangle revolved around an axis."""
-        # Create a rectangle face offset from the axis
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # A rectangle face offset from the axis; SmartRevolve only reads it, so one face serves the class
         pencil = Pencil(Plane.XZ, start=(5, 0))
         pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+        cls.face = pencil.create_face()
+
+    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
+        """Create a simple SmartRevolve for testing - a small rectangle revolved around an axis."""
+        return SmartRevolve(self.face, axis, angle, Plane.XZ)
+
+
+class TestSmartRevolveBasic(_RevolveFixture, unittest.TestCase):
 
     def test_create_plane_at_start(self) -> None:
         """Test that create_plane_at(0) returns the original sketch plane."""
@@ -47,35 +55,26 @@ class TestSmartRevolveBasic(unittest.TestCase):
         # z_dir (0, 1, 0) stays the same (Y doesn't change when rotating around Y)
         assertVectorAlmostEqual(self, plane.origin, Vector(0, 0, 0))
 
-    @parameterized.expand([
-        (0.0,),
-        (0.25,),
-        (0.5,),
-        (0.75,),
-        (1.0,),
-    ])
-    def test_create_plane_at_various_positions(self, t: float) -> None:
+    def test_create_plane_at_various_positions(self) -> None:
         """Test that create_plane_at returns valid planes at various positions."""
+        # One revolve serves every position: create_plane_at doesn't change the revolve
         revolve = self._create_simple_revolve(angle=300, axis=Axis.Z)
-        plane = revolve.create_plane_at(t)
 
-        # Verify plane directions are orthonormal
-        self.assertAlmostEqual(plane.x_dir.length, 1.0, places=5)
-        self.assertAlmostEqual(plane.y_dir.length, 1.0, places=5)
-        self.assertAlmostEqual(plane.z_dir.length, 1.0, places=5)
-        self.assertAlmostEqual(plane.x_dir.dot(plane.y_dir), 0.0, places=5)
-        self.assertAlmostEqual(plane.y_dir.dot(plane.z_dir), 0.0, places=5)
-        self.assertAlmostEqual(plane.z_dir.dot(plane.x_dir), 0.0, places=5)
+        for t in (0.0, 0.25, 0.5, 0.75, 1.0):
+            plane = revolve.create_plane_at(t)
+            basis = (plane.x_dir, plane.y_dir, plane.z_dir)
+            # The basis times its transpose is the identity for unit, mutually orthogonal directions
+            with self.subTest(t=t):
+                assertVectorsAlmostEqual(self, [tuple(a.dot(b) for b in basis) for a in basis], [(1, 0, 0), (0, 1, 0), (0, 0, 1)])
 
 
-class TestSmartRevolveWithMove(unittest.TestCase):
+class TestSmartRevolveWithMove(_RevolveFixture, unittest.TestCase):
 
-    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing."""
-        pencil = Pencil(Plane.XZ, start=(5, 0))
-        pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Revolved once; tests that move it work on their own copy
+        cls.base_revolve = SmartRevolve(cls.face, Axis.Y, 180, Plane.XZ)
 
     def test_plane_origin_moves_with_object(self) -> None:
         """Test that create_plane_at origin moves when object is moved."""
@@ -92,35 +91,50 @@ class TestSmartRevolveWithMove(unittest.TestCase):
         expected_origin = initial_origin + move_vector
         assertVectorAlmostEqual(self, moved_plane.origin, expected_origin)
 
+    def test_plane_at_start_leaves_sketch_plane_untouched(self) -> None:
+        """Test that create_plane_at(0) on a moved object returns a new plane, not the stored sketch plane."""
+        revolve = self._create_simple_revolve()
+        revolve.move(10, 20, 30)
+
+        plane = revolve.create_plane_at(0)
+
+        assertVectorAlmostEqual(self, plane.origin, Vector(10, 20, 30))
+        assertVectorAlmostEqual(self, revolve.sketch_plane.origin, Plane.XZ.origin)
+
+    def test_repeated_plane_tracks_movement(self) -> None:
+        """Test that asking for the same position again returns a fresh plane reflecting later moves."""
+        revolve = self._create_simple_revolve()
+        first = revolve.create_plane_at(0.5)
+
+        revolve.move(10, 20, 30)
+        second = revolve.create_plane_at(0.5)
+
+        self.assertIsNot(first, second)
+        assertVectorAlmostEqual(self, second.origin, first.origin + Vector(10, 20, 30))
+        assertVectorAlmostEqual(self, second.z_dir, first.z_dir)
+
     @parameterized.expand([
-        ((10, 0, 0),),
-        ((0, 15, 0),),
-        ((0, 0, 25),),
-        ((5, 10, 15),),
-        ((-5, -10, -15),),
+        (Vector(10, 0, 0),),
+        (Vector(0, 15, 0),),
+        (Vector(0, 0, 25),),
+        (Vector(5, 10, 15),),
+        (Vector(-5, -10, -15),),
     ])
     def test_plane_origin_tracks_movement(self, move_vector) -> None:
         """Test that plane origin correctly tracks object movement."""
-        revolve = self._create_simple_revolve()
+        revolve = self.base_revolve.copy()
 
         initial_plane = revolve.create_plane_at(0.5)
         initial_origin = initial_plane.origin
 
-        revolve.move_vector(Vector(move_vector))
+        revolve.move_vector(move_vector)
 
         moved_plane = revolve.create_plane_at(0.5)
-        expected_origin = initial_origin + Vector(move_vector)
+        expected_origin = initial_origin + move_vector
         assertVectorAlmostEqual(self, moved_plane.origin, expected_origin)
 
 
-class TestSmartRevolveWithRotate(unittest.TestCase):
-
-    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing."""
-        pencil = Pencil(Plane.XZ, start=(5, 0))
-        pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+class TestSmartRevolveWithRotate(_RevolveFixture, unittest.TestCase):
 
     def test_plane_rotates_with_object(self) -> None:
         """Test that create_plane_at directions rotate when object is rotated."""
@@ -139,14 +153,7 @@ class TestSmartRevolveWithRotate(unittest.TestCase):
         assertVectorAlmostEqual(self, rotated_plane.z_dir, expected_z_dir)
 
 
-class TestSmartRevolveWithOrient(unittest.TestCase):
-
-    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing."""
-        pencil = Pencil(Plane.XZ, start=(5, 0))
-        pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+class TestSmartRevolveWithOrient(_RevolveFixture, unittest.TestCase):
 
     def test_plane_orients_with_object(self) -> None:
         """Test that create_plane_at changes when object is oriented."""
@@ -161,22 +168,10 @@ class TestSmartRevolveWithOrient(unittest.TestCase):
 
         # Directions should be different after orientation
         # (unless the orientation is identity, which it's not)
-        self.assertFalse(
-            abs(initial_plane.z_dir.X - oriented_plane.z_dir.X) < 1e-5 and
-            abs(initial_plane.z_dir.Y - oriented_plane.z_dir.Y) < 1e-5 and
-            abs(initial_plane.z_dir.Z - oriented_plane.z_dir.Z) < 1e-5,
-            "Plane z_dir should change after orientation"
-        )
-
+        self.assertGreater((initial_plane.z_dir - oriented_plane.z_dir).length, VECTOR_TOLERANCE, "Plane z_dir should change after orientation")
 
-class TestSmartRevolveCopy(unittest.TestCase):
 
-    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing."""
-        pencil = Pencil(Plane.XZ, start=(5, 0))
-        pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+class TestSmartRevolveCopy(_RevolveFixture, unittest.TestCase):
 
     def test_copy_preserves_all_fields(self) -> None:
         """Test that copy() creates independent copy with all fields preserved."""
@@ -253,14 +248,7 @@ class TestPencilRevolve(unittest.TestCase):
         assertVectorAlmostEqual(self, result.axis.direction, Axis.X.direction)
 
 
-class TestSmartRevolveCombinedTransformations(unittest.TestCase):
-
-    def _create_simple_revolve(self, angle: float = 180, axis: Axis = Axis.Y) -> SmartRevolve:
-        """Create a simple SmartRevolve for testing."""
-        pencil = Pencil(Plane.XZ, start=(5, 0))
-        pencil.right(2).up(3).left(2).down(3)
-        face = pencil.create_face()
-        return SmartRevolve(face, axis, angle, Plane.XZ)
+class TestSmartRevolveCombinedTransformations(_RevolveFixture, unittest.TestCase):
 
     @parameterized.expand([
         ((0, 0, 90), (10, 20, 0)),
@@ -277,14 +265,11 @@ class TestSmartRevolveCombinedTransformations(unittest.TestCase):
         revolve.move_vector(Vector(movement))
 
         # Test that plane is still valid at various positions
-        for t in [0.0, 0.5, 1.0]:
+        for t in (0.0, 0.5, 1.0):
             plane = revolve.create_plane_at(t)
-
-            # Verify orthonormality
-            self.assertAlmostEqual(plane.x_dir.length, 1.0, places=5)
-            self.assertAlmostEqual(plane.y_dir.length, 1.0, places=5)
-            self.assertAlmostEqual(plane.z_dir.length, 1.0, places=5)
-            self.assertAlmostEqual(plane.x_dir.dot(plane.y_dir), 0.0, places=5)
+            basis = (plane.x_dir, plane.y_dir, plane.z_dir)
+            with self.subTest(t=t):
+                assertVectorsAlmostEqual(self, [tuple(a.dot(b) for b in basis) for a in basis], [(1, 0, 0), (0, 1, 0), (0, 0, 1)])
 
 
 if __name__ == '__main__':
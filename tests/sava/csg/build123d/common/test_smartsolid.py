@@ -1,4 +1,5 @@
 import unittest
+from math import sqrt
 
 from build123d import Axis, Box, Plane, ShapeList, Sphere, Vector
 from parameterized import parameterized
@@ -12,6 +13,10 @@ from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
 
 class TestSmartSolidBoundBox(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.box = SmartSolid(Box(10, 20, 30))
+
     @parameterized.expand([
         # Default XY plane
         (Plane.XY, 10, 20, 30),
@@ -22,11 +27,47 @@ class TestSmartSolidBoundBox(unittest.TestCase):
     ])
     def test_get_bound_box_standard_planes(self, plane, expected_x, expected_y, expected_z) -> None:
         """Test get_bound_box with standard planes"""
-        box = SmartSolid(Box(10, 20, 30))
-        bbox = box.get_bound_box(plane)
+        bbox = self.box.get_bound_box(plane)
 
         assertVectorAlmostEqual(self, bbox.size, (expected_x, expected_y, expected_z))
 
+    @parameterized.expand([
+        ("offset_xy", Plane.XY.offset(3)),
+        ("flipped_zy", Plane.ZY),
+        ("shifted_flipped", Plane(origin=(1, 2, 3), x_dir=(0, 0, -1), z_dir=(0, 1, 0))),
+        ("tilted", Plane.XY.rotated((0, 0, 30))),
+    ])
+    def test_get_bound_box_matches_moved_solid(self, _name, plane) -> None:
+        """World-parallel planes read the world bound box; the result matches measuring the moved solid"""
+        solid = SmartSolid(Sphere(10) - Box(8, 8, 30)).move(3, -4, 5).rotate(Axis.X, 30)
+        expected = solid.wrap_solid().moved(plane.location.inverse()).bounding_box()
+
+        bbox = solid.get_bound_box(plane)
+        assertVectorAlmostEqual(self, bbox.min, expected.min)
+        assertVectorAlmostEqual(self, bbox.max, expected.max)
+
+    def test_bound_box_cache_follows_geometry_changes(self) -> None:
+        """Cached bound box is reused while unchanged and refreshed after moves, rotations and rebuilds"""
+        box = self.box.copy()
+        self.assertIs(box.bound_box, box.bound_box)
+
+        box.move(5, 0, 0)
+        assertVectorAlmostEqual(self, box.bound_box.min, (0, -10, -15))
+
+        box.rotate(Axis.Z, 90)
+        assertVectorAlmostEqual(self, box.bound_box.size, (20, 10, 30))
+
+        box.cut(SmartSolid(Box(100, 100, 100)).move(0, 0, 50))
+        assertVectorAlmostEqual(self, box.bound_box.size, (20, 10, 15))
+        self.assertIs(box.copy().bound_box, box.bound_box)
+
+    def test_bound_box_empty_solid(self) -> None:
+        """Test bound_box with None solid raises error"""
+        with self.assertRaises(ValueError) as context:
+            _ = SmartSolid().bound_box
+
+        self.assertIn("Cannot get bound box of None solid", str(context.exception))
+
 
 class TestSmartSolidOrient(unittest.TestCase):
 
@@ -39,6 +80,15 @@ class TestSmartSolidOrient(unittest.TestCase):
         bbox = box.bound_box
         assertVectorAlmostEqual(self, bbox.size, (20, 10, 30))
 
+    def test_orient_to_current_orientation_is_noop(self) -> None:
+        """Re-applying the current orientation leaves the solid's location and cached bound box alone"""
+        box = SmartSolid(Box(10, 20, 30)).orient((0, 0, 90))
+        location, bbox = box.solid.location, box.bound_box
+
+        box.orient((0, 0, 90))
+        self.assertIs(box.bound_box, bbox)
+        self.assertTrue(box.solid.location.wrapped.IsEqual(location.wrapped))
+
     def test_orient_xz_plane(self) -> None:
         """Test orient relative to XZ plane"""
         box = SmartSolid(Box(10, 20, 30))
@@ -54,9 +104,13 @@ class TestSmartSolidOrient(unittest.TestCase):
 
 class TestSmartSolidRotate(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.box = SmartSolid(Box(10, 20, 30))
+
     def test_rotate_fixed_axes_behavior(self) -> None:
         """Test that rotate uses fixed axes, not object-attached axes"""
-        box = SmartSolid(Box(10, 20, 30))
+        box = self.box.copy()
 
         # Apply rotation (90, 90, 0) using fixed axes
         box.rotate_multi((90, 90, 0))
@@ -74,7 +128,7 @@ class TestSmartSolidRotate(unittest.TestCase):
     ])
     def test_rotate_zero_incremental(self, plane) -> None:
         """Test that (0,0,0) rotation doesn't change orientation regardless of plane"""
-        box = SmartSolid(Box(10, 20, 30))
+        box = self.box.copy()
 
         # Set some initial orientation
         initial_orientation = (45, 30, 60)
@@ -91,40 +145,52 @@ class TestSmartSolidRotate(unittest.TestCase):
         after_rotation = box.solid.orientation
         assertVectorAlmostEqual(self, after_rotation, before_rotation)
 
-
-class TestSmartSolidBoundsAlongAxis(unittest.TestCase):
-
     @parameterized.expand([
-        # Test with standard axes
-        (Axis.X, 10.0),  # X-axis along box length
-        (Axis.Y, 20.0),  # Y-axis along box width
-        (Axis.Z, 30.0),  # Z-axis along box height
+        ((0, 0, 0),),
+        ((360, 0, 0),),
+        ((0, -360, 720),),
     ])
-    def test_get_bounds_along_axis_standard_axes(self, axis, expected_size) -> None:
-        """Test get_bounds_along_axis with standard coordinate axes"""
-        box = SmartSolid(Box(10, 20, 30))
-        min_coord, max_coord = box.get_bounds_along_axis(axis)
+    def test_rotate_multi_whole_turns_is_noop(self, rotations) -> None:
+        """Test that whole-turn rotations leave the solid, origin and orientation untouched"""
+        box = self.box.copy().move(5, 6, 7).rotate_multi((45, 30, 60))
+        solid = box.solid
+        origin = Vector(box.origin)
+        orientation = Vector(box.solid.orientation)
 
-        actual_size = max_coord - min_coord
-        self.assertAlmostEqual(actual_size, expected_size, places=5)
+        box.rotate_multi(rotations)
+
+        self.assertIs(box.solid, solid)
+        assertVectorAlmostEqual(self, box.origin, origin)
+        assertVectorAlmostEqual(self, box.solid.orientation, orientation)
+
+
+class TestSmartSolidBoundsAlongAxis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.box = SmartSolid(Box(10, 20, 30))
+        cls.sphere = SmartSolid(Sphere(10))
 
     @parameterized.expand([
-        # Test with diagonal axes - bounding box projections, not face diagonals
-        (Axis((0, 0, 0), (1, 1, 0)), 21.213),  # XY projection: (10+20)/√2 = 21.213
-        (Axis((0, 0, 0), (1, 0, 1)), 28.284),  # XZ projection: (10+30)/√2 = 28.284
-        (Axis((0, 0, 0), (0, 1, 1)), 35.355),  # YZ projection: (20+30)/√2 = 35.355
+        # World axes: box dimensions
+        ((1, 0, 0), 10.0),
+        ((0, 1, 0), 20.0),
+        ((0, 0, 1), 30.0),
+        # Diagonal axes: bounding box projections, not face diagonals, e.g. XY: (10+20)/√2
+        ((1, 1, 0), 30 / sqrt(2)),
+        ((1, 0, 1), 40 / sqrt(2)),
+        ((0, 1, 1), 50 / sqrt(2)),
     ])
-    def test_get_bounds_along_axis_diagonal_axes(self, axis, expected_size) -> None:
-        """Test get_bounds_along_axis with diagonal axes"""
-        box = SmartSolid(Box(10, 20, 30))
-        min_coord, max_coord = box.get_bounds_along_axis(axis)
+    def test_get_bounds_along_axis_through_origin(self, direction, expected_size) -> None:
+        """Test get_bounds_along_axis with world and diagonal axes through the origin"""
+        min_coord, max_coord = self.box.get_bounds_along_axis(Axis((0, 0, 0), direction))
 
         actual_size = max_coord - min_coord
-        self.assertAlmostEqual(actual_size, expected_size, places=2)  # Lower precision for diagonal calculations
+        self.assertAlmostEqual(actual_size, expected_size, places=5)
 
     def test_get_bounds_along_axis_custom_origin(self) -> None:
         """Test get_bounds_along_axis with custom axis origin"""
-        box = SmartSolid(Box(10, 20, 30))
+        box = self.box
 
         # Test with axis origin at box center
         axis_through_center = Axis((5, 10, 15), (1, 0, 0))  # X-axis through box center
@@ -134,9 +200,19 @@ class TestSmartSolidBoundsAlongAxis(unittest.TestCase):
         actual_size = max_coord - min_coord
         self.assertAlmostEqual(actual_size, 10.0, places=5)
 
+    @parameterized.expand([
+        (Axis((0, 0, 5), (0, 0, 1)), (-20, 10)),
+        (Axis((0, 0, 5), (0, 0, -1)), (-10, 20)),  # Reversed: coordinates measured along -Z from z=5
+        (Axis((3, 0, 0), (-1, 0, 0)), (-2, 8)),
+    ])
+    def test_get_bounds_along_axis_offset_world_axes(self, axis, expected_bounds) -> None:
+        """Test that bounds along (possibly reversed) world axes are measured from the axis position"""
+        box = self.box
+        assertVectorAlmostEqual(self, box.get_bounds_along_axis(axis), expected_bounds)
+
     def test_get_bounds_along_axis_moved_box(self) -> None:
         """Test get_bounds_along_axis with moved box"""
-        box = SmartSolid(Box(10, 20, 30))
+        box = self.box.copy()
         box.move(100, 200, 300)  # Move box far from origin
 
         min_coord, max_coord = box.get_bounds_along_axis(Axis.X)
@@ -162,15 +238,14 @@ class TestSmartSolidBoundsAlongAxis(unittest.TestCase):
     ])
     def test_get_bounds_along_axis_sphere(self, axis, expected_diameter) -> None:
         """Test get_bounds_along_axis with sphere (radius=10)"""
-        sphere = SmartSolid(Sphere(10))
-        min_coord, max_coord = sphere.get_bounds_along_axis(axis)
+        min_coord, max_coord = self.sphere.get_bounds_along_axis(axis)
 
         actual_diameter = max_coord - min_coord
         self.assertAlmostEqual(actual_diameter, expected_diameter, places=3)
 
     def test_get_bounds_along_axis_sphere_diagonal(self) -> None:
         """Test get_bounds_along_axis with sphere along diagonal axis"""
-        sphere = SmartSolid(Sphere(10))
+        sphere = self.sphere
 
         # Test diagonal axis - should also give diameter 20
         diagonal_axis = Axis((0, 0, 0), (1, 1, 1))
@@ -226,6 +301,26 @@ class TestSmartSolidShapeList(unittest.TestCase):
         self.assertAlmostEqual(solid.x_size, 10, places=1)
         self.assertAlmostEqual(solid.y_size, 30, places=1)
 
+    def test_copy_moves_independently_of_original(self) -> None:
+        """Test that moving a ShapeList copy moves only the copy: the original keeps its shapes in place."""
+        solid = self._create_shape_list_solid()
+
+        copied = solid.copy()
+        copied.move(0, 5, 0)
+
+        self.assertIsInstance(solid.solid, ShapeList)
+        assertVectorAlmostEqual(self, copied.bound_box.min, (-5, 0, -5))
+        assertVectorAlmostEqual(self, solid.bound_box.min, (-5, -5, -5))
+
+    def test_copied_subclass_split_into_pieces_reports_bounds(self) -> None:
+        """Test that a subclass copy whose solid is cut into a ShapeList still reports its bounds."""
+        box = SmartBox(30, 10, 10).copy()
+
+        box.cut(SmartSolid(Box(2, 20, 20)))
+
+        self.assertIsInstance(box.solid, ShapeList)
+        self.assertAlmostEqual(box.x_size, 30, places=5)
+
 
 class TestSmartSolidOriginTracking(unittest.TestCase):
     """Tests for origin tracking across various transformations."""
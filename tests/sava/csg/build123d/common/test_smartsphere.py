@@ -1,6 +1,6 @@
 import unittest
 
-from build123d import Plane
+from build123d import Axis, Plane
 from parameterized import parameterized
 
 from sava.csg.build123d.common.smartsphere import SmartSphere
@@ -9,71 +9,58 @@ from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
 
 class TestSmartSphereBasic(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.spheres = {radius: SmartSphere(radius) for radius in (10.0, 25.0, 50.0, 100.0)}
+        cls.sphere = cls.spheres[50.0]
+        cls.hollow = SmartSphere(50.0, internal_radius=40.0)
+
     def test_solid_sphere_creation(self) -> None:
         """Test creating a basic solid sphere"""
-        radius = 50.0
-        sphere = SmartSphere(radius)
+        sphere = self.sphere
 
-        self.assertEqual(sphere.radius, radius)
+        self.assertEqual(sphere.radius, 50.0)
         self.assertIsNone(sphere.internal_radius)
         self.assertEqual(sphere.angle, 360)
         self.assertIsNotNone(sphere.solid)
 
-    def test_solid_sphere_dimensions(self) -> None:
-        """Test that solid sphere has correct bounding box"""
-        radius = 25.0
-        sphere = SmartSphere(radius)
-
-        self.assertAlmostEqual(sphere.x_size, radius * 2, places=5)
-        self.assertAlmostEqual(sphere.y_size, radius * 2, places=5)
-        self.assertAlmostEqual(sphere.z_size, radius * 2, places=5)
-
-    def test_solid_sphere_centered(self) -> None:
-        """Test that solid sphere is centered at origin"""
-        radius = 30.0
-        sphere = SmartSphere(radius)
+    def test_solid_sphere_dimensions_and_center(self) -> None:
+        """Test that solid sphere has correct bounding box, centered at origin"""
+        for radius in (25.0, 50.0):
+            with self.subTest(radius=radius):
+                bound_box = self.spheres[radius].bound_box
 
-        self.assertAlmostEqual(sphere.x_mid, 0, places=5)
-        self.assertAlmostEqual(sphere.y_mid, 0, places=5)
-        self.assertAlmostEqual(sphere.z_mid, 0, places=5)
+                assertVectorAlmostEqual(self, bound_box.size, (radius * 2, radius * 2, radius * 2))
+                assertVectorAlmostEqual(self, bound_box.center(), (0, 0, 0))
 
     def test_hollow_sphere_creation(self) -> None:
         """Test creating a hollow sphere"""
-        radius = 50.0
-        internal_radius = 40.0
-        sphere = SmartSphere(radius, internal_radius=internal_radius)
+        sphere = self.hollow
 
-        self.assertEqual(sphere.radius, radius)
-        self.assertEqual(sphere.internal_radius, internal_radius)
+        self.assertEqual(sphere.radius, 50.0)
+        self.assertEqual(sphere.internal_radius, 40.0)
         self.assertIsNotNone(sphere.solid)
 
     def test_hollow_sphere_dimensions(self) -> None:
         """Test that hollow sphere has correct bounding box (based on outer radius)"""
         radius = 50.0
-        internal_radius = 40.0
-        sphere = SmartSphere(radius, internal_radius=internal_radius)
+        sphere = self.hollow
 
-        self.assertAlmostEqual(sphere.x_size, radius * 2, places=5)
-        self.assertAlmostEqual(sphere.y_size, radius * 2, places=5)
-        self.assertAlmostEqual(sphere.z_size, radius * 2, places=5)
+        assertVectorAlmostEqual(self, sphere.bound_box.size, (radius * 2, radius * 2, radius * 2))
 
     def test_sphere_with_label(self) -> None:
         """Test creating sphere with a label"""
         sphere = SmartSphere(25.0, label="test_sphere")
         self.assertEqual(sphere.label, "test_sphere")
 
-    @parameterized.expand([
-        (10.0,),
-        (25.0,),
-        (50.0,),
-        (100.0,),
-    ])
-    def test_various_radii(self, radius) -> None:
+    def test_various_radii(self) -> None:
         """Test spheres with various radii"""
-        sphere = SmartSphere(radius)
+        for radius in (10.0, 25.0, 50.0, 100.0):
+            with self.subTest(radius=radius):
+                sphere = self.spheres[radius]
 
-        self.assertEqual(sphere.radius, radius)
-        self.assertAlmostEqual(sphere.x_size, radius * 2, places=5)
+                self.assertEqual(sphere.radius, radius)
+                self.assertAlmostEqual(sphere.x_size, radius * 2, places=5)
 
 
 class TestSmartSphereCreateHollow(unittest.TestCase):
@@ -107,10 +94,13 @@ class TestSmartSphereCreateHollow(unittest.TestCase):
 
 class TestSmartSpherePlane(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sphere = SmartSphere(25.0)
+
     def test_default_plane_is_xy(self) -> None:
         """Test that default plane is Plane.XY"""
-        sphere = SmartSphere(25.0)
-        self.assertEqual(sphere.plane, Plane.XY)
+        self.assertEqual(self.sphere.plane, Plane.XY)
 
     def test_sphere_with_custom_plane(self) -> None:
         """Test creating sphere with custom plane"""
@@ -121,39 +111,37 @@ class TestSmartSpherePlane(unittest.TestCase):
 
 class TestSmartSphereAngle(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.spheres = {angle: SmartSphere(50.0, angle=angle) for angle in (90, 180, 270, 360)}
+        cls.sphere = cls.spheres[360]
+        cls.hemisphere = cls.spheres[180]
+
     def test_default_angle_is_360(self) -> None:
         """Test that default angle is 360 (full sphere)"""
-        sphere = SmartSphere(25.0)
-        self.assertEqual(sphere.angle, 360)
+        self.assertEqual(self.sphere.angle, 360)
 
     def test_hemisphere_creation(self) -> None:
         """Test creating a hemisphere (180 degree angle)"""
         radius = 50.0
-        sphere = SmartSphere(radius, angle=180)
+        sphere = self.hemisphere
 
         self.assertEqual(sphere.angle, 180)
-        self.assertAlmostEqual(sphere.z_size, radius * 2, places=5)
-        # Hemisphere: angle3 sweeps around Z axis, so Y is halved while X stays full
-        self.assertAlmostEqual(sphere.x_size, radius * 2, places=5)
-        self.assertAlmostEqual(sphere.y_size, radius, places=5)
+        # Hemisphere: angle3 sweeps around Z axis, so Y is halved while X and Z stay full
+        assertVectorAlmostEqual(self, sphere.bound_box.size, (radius * 2, radius, radius * 2))
 
     def test_quarter_sphere_creation(self) -> None:
         """Test creating a quarter sphere (90 degree angle)"""
-        radius = 50.0
-        sphere = SmartSphere(radius, angle=90)
+        sphere = self.spheres[90]
 
         self.assertEqual(sphere.angle, 90)
 
-    @parameterized.expand([
-        (90,),
-        (180,),
-        (270,),
-        (360,),
-    ])
-    def test_various_angles(self, angle) -> None:
+    def test_various_angles(self) -> None:
         """Test spheres with various angles"""
-        sphere = SmartSphere(50.0, angle=angle)
-        self.assertEqual(sphere.angle, angle)
+        for angle in (90, 180, 270, 360):
+            with self.subTest(angle=angle):
+                sphere = self.spheres[angle]
+                self.assertEqual(sphere.angle, angle)
 
     def test_hollow_partial_sphere(self) -> None:
         """Test creating a hollow partial sphere"""
@@ -166,9 +154,15 @@ class TestSmartSphereAngle(unittest.TestCase):
 
 class TestSmartSphereCreateOffset(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sphere = SmartSphere(50.0)
+        cls.hollow = SmartSphere(50.0, internal_radius=40.0)
+        cls.hemisphere = SmartSphere(50.0, angle=180)
+
     def test_offset_external_positive(self) -> None:
         """Test increasing external radius"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
         offset_sphere = sphere.create_offset(5.0)
 
         self.assertEqual(offset_sphere.radius, 55.0)
@@ -176,7 +170,7 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
     def test_offset_external_negative(self) -> None:
         """Test decreasing external radius"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
         offset_sphere = sphere.create_offset(-5.0)
 
         self.assertEqual(offset_sphere.radius, 45.0)
@@ -184,7 +178,7 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
     def test_offset_internal_positive(self) -> None:
         """Test increasing internal radius"""
-        sphere = SmartSphere(50.0, internal_radius=40.0)
+        sphere = self.hollow
         offset_sphere = sphere.create_offset(5.0, external=False)
 
         self.assertEqual(offset_sphere.radius, 50.0)
@@ -192,7 +186,7 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
     def test_offset_internal_negative(self) -> None:
         """Test decreasing internal radius"""
-        sphere = SmartSphere(50.0, internal_radius=40.0)
+        sphere = self.hollow
         offset_sphere = sphere.create_offset(-5.0, external=False)
 
         self.assertEqual(offset_sphere.radius, 50.0)
@@ -200,7 +194,7 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
     def test_offset_internal_on_solid_sphere_raises(self) -> None:
         """Test that adjusting internal radius of solid sphere raises error"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
 
         with self.assertRaises(ValueError) as context:
             sphere.create_offset(5.0, external=False)
@@ -208,33 +202,33 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
     def test_offset_preserves_center(self) -> None:
         """Test that offset sphere is aligned to same center"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere.copy()
         sphere.move(10, 20, 30)
         offset_sphere = sphere.create_offset(5.0)
 
-        assertVectorAlmostEqual(self, (offset_sphere.x_mid, offset_sphere.y_mid, offset_sphere.z_mid), (10, 20, 30))
+        assertVectorAlmostEqual(self, offset_sphere.bound_box.center(), (10, 20, 30))
 
     def test_offset_preserves_label(self) -> None:
         """Test that offset sphere preserves label"""
-        sphere = SmartSphere(50.0, label="my_sphere")
+        sphere = self.sphere.copy(label="my_sphere")
         offset_sphere = sphere.create_offset(5.0)
         self.assertEqual(offset_sphere.label, "my_sphere")
 
     def test_offset_with_custom_label(self) -> None:
         """Test that offset sphere can have custom label"""
-        sphere = SmartSphere(50.0, label="original")
+        sphere = self.sphere.copy(label="original")
         offset_sphere = sphere.create_offset(5.0, label="offset")
         self.assertEqual(offset_sphere.label, "offset")
 
     def test_offset_preserves_angle(self) -> None:
         """Test that offset sphere preserves angle"""
-        sphere = SmartSphere(50.0, angle=180)
+        sphere = self.hemisphere
         offset_sphere = sphere.create_offset(5.0)
         self.assertEqual(offset_sphere.angle, 180)
 
     def test_offset_partial_sphere_preserves_rotation(self) -> None:
         """Test that offset on rotated partial sphere preserves orientation"""
-        sphere = SmartSphere(50.0, angle=180)
+        sphere = self.hemisphere.copy()
         sphere.rotate_x(90)  # Flat side now faces +Z instead of +Y
 
         offset_sphere = sphere.create_offset(5.0)
@@ -245,9 +239,15 @@ class TestSmartSphereCreateOffset(unittest.TestCase):
 
 class TestSmartSphereCreateShell(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sphere = SmartSphere(50.0)
+        cls.hollow = SmartSphere(50.0, internal_radius=40.0)
+        cls.hemisphere = SmartSphere(50.0, angle=180)
+
     def test_shell_external_positive(self) -> None:
         """Test creating shell outside solid sphere (positive offset)"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
         shell = sphere.create_shell(5.0)
 
         self.assertEqual(shell.radius, 55.0)
@@ -255,7 +255,7 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_external_negative(self) -> None:
         """Test creating shell inside solid sphere (negative offset)"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
         shell = sphere.create_shell(-5.0)
 
         self.assertEqual(shell.radius, 50.0)
@@ -263,7 +263,7 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_internal_positive(self) -> None:
         """Test creating shell on internal surface (into cavity)"""
-        sphere = SmartSphere(50.0, internal_radius=40.0)
+        sphere = self.hollow
         shell = sphere.create_shell(5.0, external=False)
 
         self.assertEqual(shell.radius, 45.0)
@@ -271,7 +271,7 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_internal_negative(self) -> None:
         """Test creating shell on internal surface (into material)"""
-        sphere = SmartSphere(50.0, internal_radius=40.0)
+        sphere = self.hollow
         shell = sphere.create_shell(-5.0, external=False)
 
         self.assertEqual(shell.radius, 40.0)
@@ -279,7 +279,7 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_internal_on_solid_raises(self) -> None:
         """Test that creating shell on internal surface of solid sphere raises error"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere
 
         with self.assertRaises(ValueError) as context:
             sphere.create_shell(5.0, external=False)
@@ -287,40 +287,37 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_preserves_center(self) -> None:
         """Test that shell sphere is aligned to same center"""
-        sphere = SmartSphere(50.0)
+        sphere = self.sphere.copy()
         sphere.move(10, 20, 30)
         shell = sphere.create_shell(5.0)
 
-        assertVectorAlmostEqual(self, (shell.x_mid, shell.y_mid, shell.z_mid), (10, 20, 30))
+        assertVectorAlmostEqual(self, shell.bound_box.center(), (10, 20, 30))
 
-    @parameterized.expand([
-        (2.0,),
-        (5.0,),
-        (10.0,),
-    ])
-    def test_shell_thickness(self, thickness) -> None:
+    def test_shell_thickness(self) -> None:
         """Test shell with various thicknesses"""
-        sphere = SmartSphere(50.0)
-        shell = sphere.create_shell(thickness)
+        sphere = self.sphere
+        for thickness in (2.0, 5.0, 10.0):
+            with self.subTest(thickness=thickness):
+                shell = sphere.create_shell(thickness)
 
-        self.assertEqual(shell.radius, 50.0 + thickness)
-        self.assertEqual(shell.internal_radius, 50.0)
+                self.assertEqual(shell.radius, 50.0 + thickness)
+                self.assertEqual(shell.internal_radius, 50.0)
 
     def test_shell_preserves_angle(self) -> None:
         """Test that shell preserves angle"""
-        sphere = SmartSphere(50.0, angle=180)
+        sphere = self.hemisphere
         shell = sphere.create_shell(5.0)
         self.assertEqual(shell.angle, 180)
 
     def test_shell_with_custom_label(self) -> None:
         """Test that shell can have custom label"""
-        sphere = SmartSphere(50.0, label="original")
+        sphere = self.sphere.copy(label="original")
         shell = sphere.create_shell(5.0, label="shell")
         self.assertEqual(shell.label, "shell")
 
     def test_shell_partial_sphere_concentric(self) -> None:
         """Test that shell on partial sphere is concentric (shares geometric center)"""
-        sphere = SmartSphere(50.0, angle=180)
+        sphere = self.hemisphere
         shell = sphere.create_shell(5.0)
 
         # For concentric hemispheres, the flat edge (y_min) should be at the same position
@@ -328,7 +325,7 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
     def test_shell_partial_sphere_preserves_rotation(self) -> None:
         """Test that shell on rotated partial sphere preserves orientation"""
-        sphere = SmartSphere(50.0, angle=180)
+        sphere = self.hemisphere.copy()
         sphere.rotate_x(90)  # Flat side now faces +Z instead of +Y
 
         shell = sphere.create_shell(5.0)
@@ -339,9 +336,13 @@ class TestSmartSphereCreateShell(unittest.TestCase):
 
 class TestSmartSphereCopy(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sphere = SmartSphere(50.0, label="original")
+
     def test_copy_solid_sphere(self) -> None:
         """Test copying a solid sphere"""
-        sphere = SmartSphere(50.0, label="original")
+        sphere = self.sphere
         copied = sphere.copy()
 
         self.assertEqual(copied.radius, 50.0)
@@ -367,33 +368,36 @@ class TestSmartSphereCopy(unittest.TestCase):
 
     def test_copy_with_new_label(self) -> None:
         """Test copying with a new label"""
-        sphere = SmartSphere(50.0, label="original")
-        copied = sphere.copy(label="copied")
+        copied = self.sphere.copy(label="copied")
 
         self.assertEqual(copied.label, "copied")
 
     def test_copy_independence(self) -> None:
         """Test that copy is independent from original"""
-        sphere = SmartSphere(50.0)
-        copied = sphere.copy()
+        copied = self.sphere.copy()
 
-        sphere.move(10, 10, 10)
+        copied.move(10, 10, 10)
 
-        assertVectorAlmostEqual(self, (copied.x_mid, copied.y_mid, copied.z_mid), (0, 0, 0))
+        assertVectorAlmostEqual(self, copied.bound_box.center(), (10, 10, 10))
+        assertVectorAlmostEqual(self, self.sphere.bound_box.center(), (0, 0, 0))
 
 
 class TestSmartSphereTransformations(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.template = SmartSphere(25.0)
+
     def test_move(self) -> None:
         """Test moving a sphere"""
-        sphere = SmartSphere(25.0)
+        sphere = self.template.copy()
         sphere.move(10, 20, 30)
 
-        assertVectorAlmostEqual(self, (sphere.x_mid, sphere.y_mid, sphere.z_mid), (10, 20, 30))
+        assertVectorAlmostEqual(self, sphere.bound_box.center(), (10, 20, 30))
 
     def test_rotate(self) -> None:
         """Test rotating a sphere (should maintain shape for sphere)"""
-        sphere = SmartSphere(25.0)
+        sphere = self.template.copy()
         sphere.move(10, 0, 0)
         sphere.rotate_z(90)
 
@@ -402,11 +406,20 @@ class TestSmartSphereTransformations(unittest.TestCase):
 
     def test_scale(self) -> None:
         """Test scaling a sphere"""
-        sphere = SmartSphere(25.0)
+        sphere = self.template.copy()
         sphere.scale(2.0)
 
         self.assertAlmostEqual(sphere.x_size, 100.0, places=5)
 
+    @parameterized.expand([
+        (Axis.Z,),
+        (Axis((0, 0, 0), (1, 1, 1)),),
+    ])
+    def test_bounds_along_axis_after_scale(self, axis) -> None:
+        """Test that bounds along an axis follow a uniform scale of the sphere"""
+        sphere = self.template.scaled(2.0)
+        assertVectorAlmostEqual(self, sphere.get_bounds_along_axis(axis), (-50, 50))
+
 
 if __name__ == '__main__':
     unittest.main()
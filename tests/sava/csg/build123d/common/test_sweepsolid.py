@@ -4,11 +4,34 @@ from build123d import Axis, Box, Circle, Edge, Plane, ShapeList, Vector, VectorL
 from parameterized import parameterized
 
 from sava.csg.build123d.common.sweepsolid import SweepSolid
-from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual
+from tests.sava.csg.build123d.test_utils import assertVectorAlmostEqual, assertVectorsAlmostEqual
+
+
+def _create_line_sweep(sketch: Circle, start: VectorLike, end: VectorLike, plane_origin: VectorLike = (0, 0, 0)) -> SweepSolid:
+    """Sweep the sketch along the straight line from start to end, on an XY-oriented path plane centred on plane_origin."""
+    path_plane = Plane(origin=plane_origin, x_dir=(1, 0, 0), z_dir=(0, 0, 1))
+    return SweepSolid(sketch, Wire([Edge.make_line(start, end)]), path_plane)
 
 
 class TestSweepSolid(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One read-only sweep per line, keyed by (start, end); tests that move or rotate take a copy()
+        sketch = Circle(0.05)
+        lines = [
+            ((0, 0, 0), (5, 0, 0)),
+            ((0, 0, 0), (0, 5, 0)),
+            ((0, 0, 0), (3, 4, 0)),
+            ((1, 1, 1), (5, 3, 2)),
+            ((2, -1, 3), (-1, 4, -2)),
+            ((1, 2, 3), (4, 6, 8)),
+            ((0, 0, 0), (10, 0, 0)),
+            ((0, 0, 0), (20, 0, 10)),
+            ((0, 0, 0), (15, 0, 0)),
+        ]
+        cls.sweeps = {line: _create_line_sweep(sketch, *line) for line in lines}
+
     @parameterized.expand([
         # Test case: (start_point, end_point)
         ((0, 0, 0), (5, 0, 0)),  # Simple horizontal line
@@ -19,19 +42,10 @@ class TestSweepSolid(unittest.TestCase):
     ])
     def test_plane_drawing_end_coordinate_mapping(self, start_point: VectorLike, end_point: VectorLike) -> None:
         """Test that (0,0,0) in create_plane_end coordinate system maps to wire end position"""
-
-        # Create a simple line wire
-        edge = Edge.make_line(start_point, end_point)
-        wire = Wire([edge])
-
-        # Create a simple sketch (small circle) for the sweep
-        sketch = Circle(0.05)
-
-        # Create the SweepSolid
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[start_point, end_point]
 
         # Verify that the wire end position matches expected
-        actual_wire_end = wire.position_at(1.0)
+        actual_wire_end = sweep_solid.path.position_at(1.0)
         assertVectorAlmostEqual(self, actual_wire_end, end_point)
 
         # Test the main requirement: (0,0,0) in create_plane_end should map to wire end position
@@ -50,10 +64,7 @@ class TestSweepSolid(unittest.TestCase):
         """Test that create_plane_end origin moves when the SweepSolid is moved after creation"""
 
         # Create a simple SweepSolid
-        edge = Edge.make_line((0, 0, 0), (5, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[(0, 0, 0), (5, 0, 0)].copy()
 
         # Get initial plane end and its origin
         initial_plane_end = sweep_solid.create_plane_end()
@@ -81,50 +92,43 @@ class TestSweepSolid(unittest.TestCase):
         expected_wire_end = Vector(5, 0, 0) + move_vector
         assertVectorAlmostEqual(self, world_position, expected_wire_end)
 
-    @parameterized.expand([
-        # Test different movement vectors
-        ((10, 0, 0),),    # Move along X
-        ((0, 15, 0),),    # Move along Y
-        ((0, 0, 25),),    # Move along Z
-        ((5, 10, 15),),   # Move along all axes
-        ((-5, -10, -15),), # Negative movement
-    ])
-    def test_plane_origin_tracks_movement(self, move_vector: VectorLike) -> None:
+    def test_plane_origin_tracks_movement(self) -> None:
         """Test that create_plane_end origin correctly tracks object movement"""
 
-        # Create a diagonal SweepSolid for more complex testing
-        edge = Edge.make_line((1, 2, 3), (4, 6, 8))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        # A diagonal SweepSolid for more complex testing, shared by every movement below
+        base = self.sweeps[(1, 2, 3), (4, 6, 8)]
 
         # Store initial state
-        initial_plane_end = sweep_solid.create_plane_end()
-        wire.position_at(1.0)
+        initial_plane_end = base.create_plane_end()
 
         # Test coordinate mapping before movement
         local_origin = (0, 0, 0)
         initial_world_pos = initial_plane_end.from_local_coords(local_origin)
 
-        # Move the object
-        sweep_solid.move_vector(Vector(move_vector))
-
-        # Get plane after movement
-        moved_plane_end = sweep_solid.create_plane_end()
-        moved_world_pos = moved_plane_end.from_local_coords(local_origin)
-
-        # The world position should have moved by the movement vector
-        expected_moved_pos = initial_world_pos + Vector(move_vector)
-        assertVectorAlmostEqual(self, moved_world_pos, expected_moved_pos)
+        movements = [
+            (10, 0, 0),  # Move along X
+            (0, 15, 0),  # Move along Y
+            (0, 0, 25),  # Move along Z
+            (5, 10, 15),  # Move along all axes
+            (-5, -10, -15),  # Negative movement
+        ]
+        for move_vector in movements:
+            with self.subTest(move_vector=move_vector):
+                # Move a copy of the object
+                sweep_solid = base.copy()
+                sweep_solid.move_vector(Vector(move_vector))
+
+                # Get plane after movement
+                moved_plane_end = sweep_solid.create_plane_end()
+                moved_world_pos = moved_plane_end.from_local_coords(local_origin)
+
+                # The world position should have moved by the movement vector
+                expected_moved_pos = initial_world_pos + Vector(move_vector)
+                assertVectorAlmostEqual(self, moved_world_pos, expected_moved_pos)
 
     def test_circle_sketch_creates_single_solid(self) -> None:
         """Test that Circle sketch creates a single Solid, not ShapeList"""
-        edge = Edge.make_line((0, 0, 0), (5, 0, 0))
-        wire = Wire([edge])
-        circle_sketch = Circle(0.05)
-
-        # Create SweepSolid with Circle sketch
-        sweep_solid = SweepSolid(circle_sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[(0, 0, 0), (5, 0, 0)]
 
         # Verify that the solid is NOT a ShapeList
         self.assertFalse(isinstance(sweep_solid.solid, ShapeList),
@@ -158,10 +162,7 @@ class TestSweepSolid(unittest.TestCase):
     ])
     def test_create_plane_end_combined_transformations(self, order: str, transform1: VectorLike, transform2: VectorLike) -> None:
         """Test create_plane_end with combined movement and rotation in different orders"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))  # Longer wire for better testing
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[(0, 0, 0), (10, 0, 0)].copy()  # Longer wire for better testing
 
         # Apply transformations in the specified order
         if order == "rotation_first":
@@ -184,15 +185,7 @@ class TestSweepSolid(unittest.TestCase):
 
     def test_create_plane_start_vs_end_with_rotation(self) -> None:
         """Test that create_plane_start and create_plane_end behave differently with rotation around wire start"""
-        edge = Edge.make_line((0, 0, 0), (20, 0, 10))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
-
-        initial_plane_start = sweep_solid.create_plane_start()
-        initial_plane_end = sweep_solid.create_plane_end()
-        initial_plane_start.from_local_coords((0, 0, 0))
-        initial_plane_end.from_local_coords((0, 0, 0))
+        sweep_solid = self.sweeps[(0, 0, 0), (20, 0, 10)].copy()
 
         sweep_solid.rotate_multi((0, 90, 0))
 
@@ -207,10 +200,7 @@ class TestSweepSolid(unittest.TestCase):
 
     def test_create_plane_start_with_combined_transformations(self) -> None:
         """Test create_plane_start with combined rotation and movement"""
-        edge = Edge.make_line((0, 0, 0), (15, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[(0, 0, 0), (15, 0, 0)].copy()
 
         # Test movement then rotation
         sweep_solid.move(5, 10, 15)
@@ -227,14 +217,17 @@ class TestSweepSolid(unittest.TestCase):
 
 
 class TestSweepSolidPathPlane(unittest.TestCase):
+    """Every test uses a sweep along (0, 0, 0) -> (10, 0, 0), copying it before transforming; only the path plane origin varies."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        sketch = Circle(0.05)
+        cls.sweeps = {origin: _create_line_sweep(sketch, (0, 0, 0), (10, 0, 0), origin) for origin in [(0, 0, 0), (5, 5, 0), (2, 3, 0)]}
 
     def test_create_path_plane_initial_state(self) -> None:
         """Test that create_path_plane initially returns the original path plane"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
         original_path_plane = Plane.XY
-        sweep_solid = SweepSolid(sketch, wire, original_path_plane)
+        sweep_solid = self.sweeps[0, 0, 0]
 
         # Get the path plane immediately after creation
         path_plane = sweep_solid.create_path_plane()
@@ -247,11 +240,8 @@ class TestSweepSolidPathPlane(unittest.TestCase):
 
     def test_create_path_plane_with_movement(self) -> None:
         """Test that create_path_plane tracks movement correctly"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
         original_path_plane = Plane.XY
-        sweep_solid = SweepSolid(sketch, wire, original_path_plane)
+        sweep_solid = self.sweeps[0, 0, 0].copy()
 
         # Move the sweep solid
         movement = Vector(5, 10, 15)
@@ -269,11 +259,7 @@ class TestSweepSolidPathPlane(unittest.TestCase):
 
     def test_create_path_plane_with_rotation(self) -> None:
         """Test that create_path_plane tracks rotation correctly"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        original_path_plane = Plane.XY
-        sweep_solid = SweepSolid(sketch, wire, original_path_plane)
+        sweep_solid = self.sweeps[0, 0, 0].copy()
 
         # Rotate the sweep solid 90 degrees around Z axis
         sweep_solid.rotate_multi((0, 0, 90))
@@ -291,12 +277,8 @@ class TestSweepSolidPathPlane(unittest.TestCase):
 
     def test_create_path_plane_with_offset_plane(self) -> None:
         """Test create_path_plane with a path plane that has an offset origin"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        # Create path plane with offset origin
-        original_path_plane = Plane(origin=(5, 5, 0), x_dir=(1, 0, 0), z_dir=(0, 0, 1))
-        sweep_solid = SweepSolid(sketch, wire, original_path_plane)
+        # Path plane with offset origin (5, 5, 0)
+        sweep_solid = self.sweeps[5, 5, 0].copy()
 
         # Rotate the sweep solid 90 degrees around Z axis
         sweep_solid.rotate_multi((0, 0, 90))
@@ -315,11 +297,7 @@ class TestSweepSolidPathPlane(unittest.TestCase):
 
     def test_create_path_plane_with_combined_transformations(self) -> None:
         """Test create_path_plane with both rotation and movement"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        original_path_plane = Plane(origin=(2, 3, 0), x_dir=(1, 0, 0), z_dir=(0, 0, 1))
-        sweep_solid = SweepSolid(sketch, wire, original_path_plane)
+        sweep_solid = self.sweeps[2, 3, 0].copy()
 
         # Apply rotation first, then movement
         sweep_solid.rotate_multi((0, 0, 90))
@@ -347,10 +325,7 @@ class TestSweepSolidPathPlane(unittest.TestCase):
     ])
     def test_create_path_plane_coordinate_consistency(self, rotation: VectorLike) -> None:
         """Test that create_path_plane maintains coordinate system consistency"""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        sweep_solid = SweepSolid(sketch, wire, Plane.XY)
+        sweep_solid = self.sweeps[0, 0, 0].copy()
 
         # Apply rotation and movement
         sweep_solid.rotate_multi(rotation)
@@ -359,32 +334,23 @@ class TestSweepSolidPathPlane(unittest.TestCase):
         # Get the path plane
         path_plane = sweep_solid.create_path_plane()
 
-        # Test that the plane's coordinate directions are orthonormal
-        x_dir, y_dir, z_dir = path_plane.x_dir, path_plane.y_dir, path_plane.z_dir
-
-        # Each direction should be unit vector
-        self.assertAlmostEqual(x_dir.length, 1.0, places=5)
-        self.assertAlmostEqual(y_dir.length, 1.0, places=5)
-        self.assertAlmostEqual(z_dir.length, 1.0, places=5)
+        # The basis times its transpose is the identity for unit, mutually orthogonal directions
+        basis = (path_plane.x_dir, path_plane.y_dir, path_plane.z_dir)
+        assertVectorsAlmostEqual(self, [tuple(a.dot(b) for b in basis) for a in basis], [(1, 0, 0), (0, 1, 0), (0, 0, 1)])
 
-        # Directions should be orthogonal
-        self.assertAlmostEqual(x_dir.dot(y_dir), 0.0, places=5)
-        self.assertAlmostEqual(y_dir.dot(z_dir), 0.0, places=5)
-        self.assertAlmostEqual(z_dir.dot(x_dir), 0.0, places=5)
-
-        # Should form a right-handed coordinate system
-        cross_product = x_dir.cross(y_dir)
-        assertVectorAlmostEqual(self, cross_product, z_dir)
+        # x cross y gives +z rather than -z, so the system is right-handed
+        assertVectorAlmostEqual(self, path_plane.x_dir.cross(path_plane.y_dir), path_plane.z_dir)
 
 
 class TestSweepSolidRotateMulti(unittest.TestCase):
     """Tests for rotation operations on SweepSolid."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sweep = _create_line_sweep(Circle(0.05), (0, 0, 0), (10, 0, 0))
+
     def _create_sweep(self) -> SweepSolid:
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        return SweepSolid(sketch, wire, Plane.XY)
+        return self.sweep.copy()
 
     def test_rotate_multi_then_move_plane_end_consistent(self) -> None:
         """Test rotate_multi + move: plane_end coordinate mapping stays self-consistent."""
@@ -431,11 +397,12 @@ class TestSweepSolidRotateMulti(unittest.TestCase):
 class TestSweepSolidConsecutiveRotations(unittest.TestCase):
     """Tests for consecutive rotation calls — previously broken by double-rotation bug."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sweep = _create_line_sweep(Circle(0.05), (0, 0, 0), (10, 0, 0))
+
     def _create_sweep(self) -> SweepSolid:
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        return SweepSolid(sketch, wire, Plane.XY)
+        return self.sweep.copy()
 
     def test_two_rotate_multi_equal_single(self) -> None:
         """Two 45° Z rotations should equal one 90° rotation."""
@@ -479,11 +446,8 @@ class TestSweepSolidConsecutiveRotations(unittest.TestCase):
 
     def test_consecutive_orient_with_offset_plane(self) -> None:
         """Consecutive orient() calls with offset plane don't double-rotate."""
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        offset_plane = Plane(origin=(5, 5, 0), x_dir=(1, 0, 0), z_dir=(0, 0, 1))
-        sweep = SweepSolid(sketch, wire, offset_plane)
+        # Path plane with offset origin (5, 5, 0)
+        sweep = _create_line_sweep(Circle(0.05), (0, 0, 0), (10, 0, 0), (5, 5, 0))
 
         # First orient
         sweep.orient((0, 0, 90))
@@ -501,11 +465,12 @@ class TestSweepSolidConsecutiveRotations(unittest.TestCase):
 class TestSweepSolidRotateAxis(unittest.TestCase):
     """Tests for SweepSolid.rotate(Axis, angle) — previously broken."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sweep = _create_line_sweep(Circle(0.05), (0, 0, 0), (10, 0, 0))
+
     def _create_sweep(self) -> SweepSolid:
-        edge = Edge.make_line((0, 0, 0), (10, 0, 0))
-        wire = Wire([edge])
-        sketch = Circle(0.05)
-        return SweepSolid(sketch, wire, Plane.XY)
+        return self.sweep.copy()
 
     def test_rotate_z_90_plane_directions(self) -> None:
         """rotate(Axis.Z, 90) should rotate plane directions."""
@@ -8,10 +8,15 @@ from sava.csg.build123d.common.text import TextDimensions, create_text
 
 class TestTextSolidRotation(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Font parsing dominates these tests: extrude each letter once, tests copy() before transforming
+        cls.dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
+        cls.letters = {letter: create_text(cls.dim, letter) for letter in "ABCHIJ"}
+
     def test_text_is_valid_after_orient(self) -> None:
         """Test that text remains valid after orient()"""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
-        text = create_text(dim, "A")
+        text = self.letters["A"].copy()
 
         text.orient((0, 0, 180))
 
@@ -19,8 +24,7 @@ class TestTextSolidRotation(unittest.TestCase):
 
     def test_text_is_valid_after_rotate(self) -> None:
         """Test that text remains valid after rotate()"""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
-        text = create_text(dim, "A")
+        text = self.letters["A"].copy()
 
         text.rotate_multi((0, 0, 180))
 
@@ -28,20 +32,15 @@ class TestTextSolidRotation(unittest.TestCase):
 
     def test_text_is_valid_after_rotate_with_axis(self) -> None:
         """Test that text remains valid after rotate_with_axis()"""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
-        text = create_text(dim, "A")
+        text = self.letters["A"].copy()
 
         text.rotate(Axis.Z, 180)
 
         self.assertTrue(text.wrap_solid().is_valid)
 
-        mesher = Mesher()
-        mesher.add_shape(text.wrap_solid())
-
     def test_text_mesh_valid_after_rotate_with_axis(self) -> None:
         """Test that text can be meshed after rotate_with_axis()"""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
-        text = create_text(dim, "H")
+        text = self.letters["H"].copy()
 
         text.rotate(Axis.Z, 180)
 
@@ -50,12 +49,11 @@ class TestTextSolidRotation(unittest.TestCase):
 
     def test_multiple_rotated_texts_combined_and_meshed(self) -> None:
         """Test combining multiple rotated texts into SmartSolid and meshing"""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
         labels = ["A", "B", "C", "H", "I", "J"]
         texts = []
 
         for i, label in enumerate(labels):
-            text = create_text(dim, label)
+            text = self.letters[label].copy()
             text.move(i * 20, 0, 0)
             if i >= 3:
                 text.rotate(Axis.Z, 180)
@@ -70,8 +68,7 @@ class TestTextSolidRotation(unittest.TestCase):
 
     def test_multichar_text_rotate_works(self) -> None:
         """Test that multi-char text (ShapeList) works with rotate_multi() after orientation replacement."""
-        dim = TextDimensions(font_size=12, font="Liberation Sans", height=0.8)
-        text = create_text(dim, "E/F")
+        text = create_text(self.dim, "E/F")
 
         text.rotate_multi((0, 0, 180))
 
@@ -1,21 +1,44 @@
 """Common test utilities for build123d tests."""
 
+from collections.abc import Iterable
+
+import numpy as np
 from build123d import Vector, VectorLike
 
 # Fixed precision for all vector comparisons
 VECTOR_PRECISION_PLACES = 5
+# assertAlmostEqual(places=n) passes when round(a - b, n) == 0, i.e. |a - b| <= 0.5 * 10**-n
+VECTOR_TOLERANCE = 0.5 * 10 ** -VECTOR_PRECISION_PLACES
 
 
 def assertVectorAlmostEqual(test_case, vector1: VectorLike, vector2: VectorLike) -> None:
     """Helper function to compare two vectors with fixed precision.
 
+    All three components are compared in one numpy call; a mismatch is reported through the test case,
+    so it carries the test's failure type and subTest context.
+
     Args:
-        test_case: The test case instance (for accessing assertAlmostEqual)
+        test_case: The test case instance that reports the failure
         vector1: First vector to compare (can be Vector, tuple, or list)
         vector2: Second vector to compare (can be Vector, tuple, or list)
     """
-    v1 = Vector(vector1)
-    v2 = Vector(vector2)
-    test_case.assertAlmostEqual(v1.X, v2.X, places=VECTOR_PRECISION_PLACES)
-    test_case.assertAlmostEqual(v1.Y, v2.Y, places=VECTOR_PRECISION_PLACES)
-    test_case.assertAlmostEqual(v1.Z, v2.Z, places=VECTOR_PRECISION_PLACES)
+    actual, expected = np.array(tuple(Vector(vector1))), np.array(tuple(Vector(vector2)))
+    if not np.allclose(actual, expected, rtol=0, atol=VECTOR_TOLERANCE):
+        test_case.fail(f"{tuple(actual.tolist())} != {tuple(expected.tolist())} within {VECTOR_TOLERANCE} "
+                       f"(differences {tuple(np.abs(actual - expected).tolist())})")
+
+
+def assertVectorsAlmostEqual(test_case, vectors1: Iterable[VectorLike], vectors2: Iterable[VectorLike]) -> None:
+    """Helper function to compare two lists of vectors, row by row, with the same fixed precision.
+
+    The lists are stacked into matrices and compared in one numpy call, so e.g. both ends of a profile
+    or every row of a plane basis are checked at once.
+
+    Args:
+        test_case: The test case instance that reports the failure
+        vectors1: First list of vectors to compare (each can be Vector, tuple, or list)
+        vectors2: Second list of vectors to compare (each can be Vector, tuple, or list)
+    """
+    actual, expected = (np.array([tuple(Vector(vector)) for vector in vectors]) for vectors in (vectors1, vectors2))
+    if actual.shape != expected.shape or not np.allclose(actual, expected, rtol=0, atol=VECTOR_TOLERANCE):
+        test_case.fail(f"{actual.tolist()} != {expected.tolist()} within {VECTOR_TOLERANCE}")